@@ -1,10 +1,11 @@
-from typing import Iterable, List, Sequence
+from functools import lru_cache
+from typing import Any, Dict, Iterable, Mapping, Sequence
 
 from deepagents.graph import SubAgent
 from langchain.tools import BaseTool
 
-from kratos.subagents.registry import SubAgentSpec, ToolBinding, registry
-from kratos.subagents import specs  # noqa: F401  # ensure registration side-effects
+from kratos.subagents.registry import SubAgentSpec, registry
+from kratos.subagents import specs  # noqa: F401  # declare lazily-loaded specs
 
 
 ADDITIONAL_INSTRUCTIONS = """
@@ -27,7 +28,7 @@ When handling technical indicators (MACD, SMA, RSI, etc.):
 
 def build_enhanced_system_prompt(
     base_prompt: str,
-    output_format: dict,
+    output_format: Mapping[str, Any],
     additional_instructions: str,
 ) -> str:
     """
@@ -35,12 +36,17 @@ def build_enhanced_system_prompt(
 
     Args:
         base_prompt: The original system prompt from system_prompts.py
-        output_format: The output format specification dictionary
+        output_format: The output format specification mapping
         additional_instructions: Additional instructions to append
 
     Returns:
         Enhanced system prompt with output format guidelines
     """
+    options = output_format.get("options") if output_format else None
+    if not options:
+        # Nothing to choose between, so skip the format guidelines entirely.
+        return f"{base_prompt}\n\n{additional_instructions}"
+
     output_format_instructions = """
 
 ## Output Format Guidelines
@@ -50,9 +56,8 @@ You can return your analysis in one of the following formats based on the comple
 """
 
     # Add each output format option
-    if output_format and "options" in output_format:
-        for idx, option in enumerate(output_format["options"], 1):
-            output_format_instructions += f"""
+    for idx, option in enumerate(options, 1):
+        output_format_instructions += f"""
 {idx}. **{option['format'].replace('_', ' ').title()}**
    - {option['description']}
 """
@@ -91,29 +96,25 @@ def get_financial_tools() -> list[BaseTool]:
     return TOOLS
 
 
-def _tool_name(binding: ToolBinding) -> str:
-    return binding.id
-
-
-def list_subagent_specs(names: Iterable[str] | None = None) -> List[SubAgentSpec]:
+def list_subagent_specs(names: Iterable[str] | None = None) -> Sequence[SubAgentSpec]:
     """Return registered subagent specs, optionally filtered by name."""
     return registry.list(names)
 
 
-def build_subagents(enabled: Sequence[str] | None = None) -> list[SubAgent]:
-    """Build a list of financial subagents with enhanced prompts and tools.
+@lru_cache(maxsize=1)
+def _all_subagents() -> Dict[str, SubAgent]:
+    """Build every registered subagent once, keyed by name.
 
-    Args:
-        enabled: Optional sequence of subagent names to include. Defaults to all.
+    Specs are immutable configuration, so the resulting SubAgent entries are
+    shared between callers of ``build_subagents`` and must not be mutated.
+    The registry is sealed here, since every spec has been loaded by now.
     """
-    specs_to_build = list_subagent_specs(enabled)
-    subagents: list[SubAgent] = []
+    registry.seal()
     tools = get_financial_tools()
     tool_map = {tool.name: tool for tool in tools}
+    subagents: Dict[str, SubAgent] = {}
 
-    for spec in specs_to_build:
-        sub_agent_tool_names = [_tool_name(binding) for binding in spec.tools]
-
+    for spec in list_subagent_specs():
         output_format = spec.output_format or {}
         enhanced_prompt = build_enhanced_system_prompt(
             base_prompt=spec.prompt,
@@ -122,21 +123,37 @@ def build_subagents(enabled: Sequence[str] | None = None) -> list[SubAgent]:
         )
 
         matched_tools = [
-            tool_map[name] for name in sub_agent_tool_names if name in tool_map
+            tool_map[binding.id] for binding in spec.tools if binding.id in tool_map
         ]
 
-        subagents.append(
-            SubAgent(
-                name=spec.name,
-                description=spec.description,
-                system_prompt=enhanced_prompt,
-                tools=matched_tools,
-            )
+        subagents[spec.name] = SubAgent(
+            name=spec.name,
+            description=spec.description,
+            system_prompt=enhanced_prompt,
+            tools=matched_tools,
         )
 
     return subagents
 
 
+def build_subagents(enabled: Sequence[str] | None = None) -> list[SubAgent]:
+    """Build a list of financial subagents with enhanced prompts and tools.
+
+    Args:
+        enabled: Optional sequence of subagent names to include. Defaults to all.
+    """
+    subagents = _all_subagents()
+    if enabled is None:
+        return list(subagents.values())
+    try:
+        return [subagents[name] for name in enabled]
+    except KeyError as exc:
+        available = ", ".join(subagents)
+        raise KeyError(
+            f"Unknown subagent '{exc.args[0]}'. Available subagents: {available}."
+        ) from None
+
+
 __all__ = [
     "build_subagents",
     "list_subagent_specs",
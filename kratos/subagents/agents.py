@@ -1,13 +1,10 @@
 from __future__ import annotations
 
-from typing import Dict, List
+from functools import cache
+from typing import Dict, List, Optional, Sequence
 
-from kratos.subagents.registry import SubAgentSpec, ToolBinding, registry
-from kratos.subagents import specs  # noqa: F401  # ensure registration side-effects
-
-
-def _binding_to_dict(binding: ToolBinding) -> Dict[str, str]:
-    return {"tool": binding.id, "description": binding.description}
+from kratos.subagents.registry import SubAgentSpec, registry
+from kratos.subagents import specs  # noqa: F401  # declare lazily-loaded specs
 
 
 def _spec_to_legacy_payload(spec: SubAgentSpec) -> Dict[str, object]:
@@ -16,15 +13,40 @@ def _spec_to_legacy_payload(spec: SubAgentSpec) -> Dict[str, object]:
         "description": spec.description,
         "system_prompt": spec.prompt,
         "output_format": spec.output_format,
-        "tools": [_binding_to_dict(binding) for binding in spec.tools],
+        "tools": [
+            {"tool": binding.id, "description": binding.description}
+            for binding in spec.tools
+        ],
     }
 
 
-def get_registered_subagents() -> List[SubAgentSpec]:
+def get_registered_subagents() -> Sequence[SubAgentSpec]:
     """Return all registered subagent specs."""
     return registry.list()
 
 
-ALPHA_VANTAGE_SUBAGENTS: List[Dict[str, object]] = [
-    _spec_to_legacy_payload(spec) for spec in get_registered_subagents()
-]
+@cache
+def get_subagents() -> List[Dict[str, object]]:
+    """Return legacy category payloads for every subagent, built on first use."""
+    return [_spec_to_legacy_payload(spec) for spec in get_registered_subagents()]
+
+
+@cache
+def _tool_categories() -> Dict[str, str]:
+    return {
+        tool["tool"]: category["category"]
+        for category in get_subagents()
+        for tool in category["tools"]
+    }
+
+
+def lookup_category(tool_name: str) -> Optional[str]:
+    """Return the subagent category that declares ``tool_name``, if any."""
+    return _tool_categories().get(tool_name)
+
+
+def __getattr__(name: str):
+    # ``ALPHA_VANTAGE_SUBAGENTS`` used to be built at import; keep it for callers.
+    if name == "ALPHA_VANTAGE_SUBAGENTS":
+        return get_subagents()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
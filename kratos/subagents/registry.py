@@ -1,7 +1,21 @@
 from __future__ import annotations
 
+import sys
+import threading
+from collections import Counter, defaultdict
 from dataclasses import dataclass, field
-from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional
+from functools import cache
+from importlib import import_module
+from types import MappingProxyType
+from typing import Any, Callable, DefaultDict, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+from kratos.subagents._lazy import lazy
+
+# Prompt text is only parsed once a spec actually reads its definition.
+system_prompts = lazy("kratos.subagents.system_prompts")
+
+
+_EMPTY_META: Mapping[str, Any] = MappingProxyType({})
 
 
 @dataclass(frozen=True, slots=True)
@@ -11,6 +25,34 @@ class ToolBinding:
     id: str
     description: str
 
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "id", sys.intern(self.id))
+        object.__setattr__(self, "description", sys.intern(self.description))
+
+
+# Shared by every spec without tools; ``spec.tools is NO_TOOLS`` is a valid check.
+NO_TOOLS: Tuple[ToolBinding, ...] = ()
+
+_BINDING_CACHE: Dict[Tuple[str, str], ToolBinding] = {}
+
+
+def tool_binding(id: str, description: str) -> ToolBinding:
+    """Return a shared ``ToolBinding`` for ``(id, description)``.
+
+    Identical bindings declared by several specs resolve to the same object.
+    """
+    key = (id, description)
+    binding = _BINDING_CACHE.get(key)
+    if binding is None:
+        binding = _BINDING_CACHE[key] = ToolBinding(id, description)
+    return binding
+
+
+@cache
+def prompt_definition(name: str) -> Mapping[str, Any]:
+    """Return the ``SYSTEM_PROMPTS`` entry for ``name``, resolved once per name."""
+    return system_prompts.SYSTEM_PROMPTS[name]
+
 
 @dataclass(frozen=True, slots=True)
 class SubAgentSpec:
@@ -19,10 +61,22 @@ class SubAgentSpec:
     name: str
     description: str
     prompt: str
-    tools: List[ToolBinding]
+    tools: Tuple[ToolBinding, ...]
     output_format: Optional[Mapping[str, Any]] = None
     group: Optional[str] = None
-    metadata: Mapping[str, Any] = field(default_factory=dict)
+    metadata: Mapping[str, Any] = field(default_factory=lambda: _EMPTY_META)
+    tools_by_id: Mapping[str, ToolBinding] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(
+            self, "tools_by_id", MappingProxyType({tool.id: tool for tool in self.tools})
+        )
+
+    def has_tool(self, tool_id: str) -> bool:
+        return tool_id in self.tools_by_id
+
+    def get_tool(self, tool_id: str) -> Optional[ToolBinding]:
+        return self.tools_by_id.get(tool_id)
 
 
 class SubAgentRegistry:
@@ -30,12 +84,57 @@ class SubAgentRegistry:
 
     def __init__(self) -> None:
         self._specs: Dict[str, SubAgentSpec] = {}
+        self._lazy: Dict[str, str] = {}
+        self._snapshot: Optional[Tuple[SubAgentSpec, ...]] = None
+        self._groups_cache: Optional[Mapping[str, Tuple[SubAgentSpec, ...]]] = None
+        self._frozen: Optional[Mapping[str, SubAgentSpec]] = None
+        # Serialises lazy spec imports so concurrent first lookups register once.
+        # Re-entrant because a spec module may itself look up other specs.
+        self._load_lock = threading.RLock()
+
+    @property
+    def specs(self) -> Mapping[str, SubAgentSpec]:
+        """Read-only view of the registered specs, keyed by name."""
+        if self._frozen is not None:
+            return self._frozen
+        return MappingProxyType(self._specs)
+
+    @property
+    def sealed(self) -> bool:
+        """Whether ``seal()`` has been called."""
+        return self._frozen is not None
+
+    def seal(self) -> None:
+        """Load any pending specs and reject further registrations.
+
+        Sealing also builds the listing and group caches up front, so reads
+        after startup never rebuild them.
+        """
+        if self._frozen is not None:
+            return
+        self._load_all()
+        self._frozen = MappingProxyType(self._specs)
+        self._snapshot = tuple(self._specs.values())
+        self._groups_cache = self._build_groups()
+
+    def _check_open(self) -> None:
+        if self._frozen is not None:
+            raise RuntimeError("Subagent registry is sealed; no further registrations allowed.")
 
     def register(self, spec: SubAgentSpec) -> SubAgentSpec:
-        """Register a new subagent specification."""
-        if spec.name in self._specs:
-            raise ValueError(f"Subagent '{spec.name}' already registered.")
+        """Register a new subagent specification.
+
+        The duplicate-name check is a developer invariant and is skipped under
+        ``python -O``; ``register_many`` always validates its batch.
+        """
+        self._check_open()
+        if __debug__:
+            if spec.name in self._specs:
+                raise ValueError(f"Subagent '{spec.name}' already registered.")
         self._specs[spec.name] = spec
+        self._lazy.pop(spec.name, None)
+        self._snapshot = None
+        self._groups_cache = None
         return spec
 
     def register_from_factory(
@@ -45,26 +144,91 @@ class SubAgentRegistry:
         spec = factory()
         return self.register(spec)
 
-    def get(self, name: str) -> SubAgentSpec:
-        try:
-            return self._specs[name]
-        except KeyError as exc:
-            raise KeyError(f"Unknown subagent '{name}'.") from exc
+    def register_many(self, specs: Iterable[SubAgentSpec]) -> None:
+        """Register several subagent specifications in one call.
+
+        Names repeated within the batch, or colliding with already registered
+        names, are reported together and nothing from the batch is registered.
+        """
+        self._check_open()
+        batch = tuple(specs)
+        new = {spec.name: spec for spec in batch}
+        if len(new) != len(batch):
+            counts = Counter(spec.name for spec in batch)
+            repeated = [name for name, count in counts.items() if count > 1]
+            raise ValueError(f"Duplicate subagent names in batch: {', '.join(sorted(repeated))}.")
+        dups = new.keys() & self._specs.keys()
+        if dups:
+            raise ValueError(f"Subagents already registered: {', '.join(sorted(dups))}.")
+        self._specs.update(new)
+        for name in new:
+            self._lazy.pop(name, None)
+        self._snapshot = None
+        self._groups_cache = None
+
+    def register_lazy(self, modules: Mapping[str, str]) -> None:
+        """Declare subagents whose spec modules are imported on first use.
+
+        Args:
+            modules: Mapping of subagent name to a module exposing its ``SPEC``.
+        """
+        for name, module_path in modules.items():
+            if name not in self._specs:
+                self._lazy[name] = module_path
+
+    def _load(self, name: str) -> None:
+        with self._load_lock:
+            if name in self._specs:
+                return
+            module_path = self._lazy.get(name)
+            if module_path is not None:
+                self.register(import_module(module_path).SPEC)
+
+    def _load_all(self) -> None:
+        if not self._lazy:
+            return
+        with self._load_lock:
+            if self._lazy:
+                self.register_many(
+                    import_module(module_path).SPEC for module_path in list(self._lazy.values())
+                )
 
-    def list(self, names: Optional[Iterable[str]] = None) -> List[SubAgentSpec]:
+    def get(self, name: str) -> SubAgentSpec:
+        spec = self._specs.get(name)
+        if spec is not None:
+            return spec
+        self._load(name)
+        spec = self._specs.get(name)
+        if spec is not None:
+            return spec
+        raise KeyError(f"Unknown subagent '{name}'.")
+
+    def list(self, names: Optional[Iterable[str]] = None) -> Sequence[SubAgentSpec]:
+        """Return specs in registration order, or the named ones in the given order.
+
+        The unfiltered result is a tuple shared between callers until the next
+        registration.
+        """
         if names is None:
-            return list(self._specs.values())
-        selected: List[SubAgentSpec] = []
-        for name in names:
-            selected.append(self.get(name))
-        return selected
-
-    def groups(self) -> Dict[str, List[SubAgentSpec]]:
-        grouped: Dict[str, List[SubAgentSpec]] = {}
+            self._load_all()
+            if self._snapshot is None:
+                self._snapshot = tuple(self._specs.values())
+            return self._snapshot
+        get = self.get
+        return [get(name) for name in names]
+
+    def groups(self) -> Mapping[str, Tuple[SubAgentSpec, ...]]:
+        """Return specs grouped by ``group``; cached until the next registration."""
+        self._load_all()
+        if self._groups_cache is None:
+            self._groups_cache = self._build_groups()
+        return self._groups_cache
+
+    def _build_groups(self) -> Mapping[str, Tuple[SubAgentSpec, ...]]:
+        grouped: DefaultDict[str, List[SubAgentSpec]] = defaultdict(list)
         for spec in self._specs.values():
-            key = spec.group or "default"
-            grouped.setdefault(key, []).append(spec)
-        return grouped
+            grouped[spec.group or "default"].append(spec)
+        return MappingProxyType({key: tuple(specs) for key, specs in grouped.items()})
 
 
 registry = SubAgentRegistry()
@@ -79,8 +243,11 @@ def register_subagent(factory: Callable[[], SubAgentSpec]) -> Callable[[], SubAg
 
 __all__ = [
     "ToolBinding",
+    "NO_TOOLS",
+    "tool_binding",
     "SubAgentSpec",
     "SubAgentRegistry",
+    "prompt_definition",
     "registry",
     "register_subagent",
 ]
@@ -1,27 +1,57 @@
 """
-Module import side-effects register subagents with the global registry.
+Subagent spec modules, imported lazily the first time each subagent is used.
+
+Every module is plain data exposing a module-level ``SPEC``; the registry
+ingests it when the module is first needed. Names are declared up front so
+``registry.get(name)`` only pays for the module it needs, while
+``registry.list()`` still sees every spec.
+Submodules are likewise resolved on first attribute access.
 """
 
+import warnings
+from functools import lru_cache
 from importlib import import_module
+from typing import List
+
+from kratos.subagents.registry import registry
+
+_SPEC_MODULES = {
+    "core_stock_apis": "kratos.subagents.specs.core_stock",
+    "options_data_apis": "kratos.subagents.specs.options",
+    "alpha_intelligence": "kratos.subagents.specs.alpha_intelligence",
+    "fundamental_data": "kratos.subagents.specs.fundamentals",
+    "forex": "kratos.subagents.specs.forex",
+    "cryptocurrencies": "kratos.subagents.specs.crypto",
+    "commodities": "kratos.subagents.specs.commodities",
+    "economic_indicators": "kratos.subagents.specs.economics",
+    "technical_indicators": "kratos.subagents.specs.technicals",
+    "codeact": "kratos.subagents.specs.codeact",
+    "search_web": "kratos.subagents.specs.search",
+    "final_report": "kratos.subagents.specs.final_report",
+}
+
+_SUBMODULES = {path.rpartition(".")[2]: path for path in _SPEC_MODULES.values()}
+
+registry.register_lazy(_SPEC_MODULES)
+
 
-_MODULES = [
-    "kratos.subagents.specs.core_stock",
-    "kratos.subagents.specs.options",
-    "kratos.subagents.specs.alpha_intelligence",
-    "kratos.subagents.specs.fundamentals",
-    "kratos.subagents.specs.forex",
-    "kratos.subagents.specs.crypto",
-    "kratos.subagents.specs.commodities",
-    "kratos.subagents.specs.economics",
-    "kratos.subagents.specs.technicals",
-    "kratos.subagents.specs.codeact",
-    "kratos.subagents.specs.search",
-    "kratos.subagents.specs.final_report"
-]
+@lru_cache(maxsize=1)
+def _deprecated_modules() -> List[str]:
+    warnings.warn(
+        "kratos.subagents.specs._MODULES is deprecated; use registry.list() instead.",
+        DeprecationWarning,
+        stacklevel=3,
+    )
+    return list(_SPEC_MODULES.values())
 
 
-for module_path in _MODULES:
-    import_module(module_path)
+def __getattr__(name: str):
+    if name in _SUBMODULES:
+        return import_module(_SUBMODULES[name])
+    if name == "_MODULES":
+        return _deprecated_modules()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
-__all__ = ["_MODULES"]
+def __dir__():
+    return [*globals(), *_SUBMODULES]
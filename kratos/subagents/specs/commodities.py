@@ -1,27 +1,25 @@
-from kratos.subagents.registry import SubAgentSpec, ToolBinding, register_subagent
-from kratos.subagents.system_prompts import SYSTEM_PROMPTS
+from kratos.subagents.registry import SubAgentSpec, prompt_definition, tool_binding
 
 
-@register_subagent
-def commodities_spec() -> SubAgentSpec:
-    prompt_def = SYSTEM_PROMPTS["commodities"]
-    return SubAgentSpec(
-        name="commodities",
-        description="Global commodities pricing for energy, metals, and agricultural products",
-        prompt=prompt_def["prompt"],
-        output_format=prompt_def["output_format"],
-        tools=[
-            ToolBinding("WTI", "West Texas Intermediate (WTI) crude oil prices"),
-            ToolBinding("BRENT", "Brent crude oil prices"),
-            ToolBinding("NATURAL_GAS", "Henry Hub natural gas spot prices"),
-            ToolBinding("COPPER", "Global copper prices"),
-            ToolBinding("ALUMINUM", "Global aluminum prices"),
-            ToolBinding("WHEAT", "Global wheat prices"),
-            ToolBinding("CORN", "Global corn prices"),
-            ToolBinding("COTTON", "Global cotton prices"),
-            ToolBinding("SUGAR", "Global sugar prices"),
-            ToolBinding("COFFEE", "Global coffee prices"),
-            ToolBinding("ALL_COMMODITIES", "All commodities prices"),
-        ],
-        group="market_data",
-    )
+_prompt_def = prompt_definition("commodities")
+
+SPEC = SubAgentSpec(
+    name="commodities",
+    description="Global commodities pricing for energy, metals, and agricultural products",
+    prompt=_prompt_def["prompt"],
+    output_format=_prompt_def["output_format"],
+    tools=(
+        tool_binding("WTI", "West Texas Intermediate (WTI) crude oil prices"),
+        tool_binding("BRENT", "Brent crude oil prices"),
+        tool_binding("NATURAL_GAS", "Henry Hub natural gas spot prices"),
+        tool_binding("COPPER", "Global copper prices"),
+        tool_binding("ALUMINUM", "Global aluminum prices"),
+        tool_binding("WHEAT", "Global wheat prices"),
+        tool_binding("CORN", "Global corn prices"),
+        tool_binding("COTTON", "Global cotton prices"),
+        tool_binding("SUGAR", "Global sugar prices"),
+        tool_binding("COFFEE", "Global coffee prices"),
+        tool_binding("ALL_COMMODITIES", "All commodities prices"),
+    ),
+    group="market_data",
+)
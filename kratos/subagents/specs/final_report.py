@@ -1,17 +1,13 @@
-from kratos.subagents.registry import SubAgentSpec, ToolBinding, register_subagent
-from kratos.subagents.system_prompts import SYSTEM_PROMPTS
+from kratos.subagents.registry import NO_TOOLS, SubAgentSpec, prompt_definition
 
 
-@register_subagent
-def final_report() -> SubAgentSpec:
-    prompt_def = SYSTEM_PROMPTS["final_report"]
-    return SubAgentSpec(
-        name="final_report",
-        description="Final Consolidated Report of all the generated artifacts",
-        prompt=prompt_def["prompt"],
-        output_format=prompt_def["output_format"],
-        tools=[
-          
-        ],
-        group="utilities",
-    )
+_prompt_def = prompt_definition("final_report")
+
+SPEC = SubAgentSpec(
+    name="final_report",
+    description="Final Consolidated Report of all the generated artifacts",
+    prompt=_prompt_def["prompt"],
+    output_format=_prompt_def["output_format"],
+    tools=NO_TOOLS,
+    group="utilities",
+)
@@ -1,24 +1,22 @@
-from kratos.subagents.registry import SubAgentSpec, ToolBinding, register_subagent
-from kratos.subagents.system_prompts import SYSTEM_PROMPTS
+from kratos.subagents.registry import SubAgentSpec, prompt_definition, tool_binding
 
 
-@register_subagent
-def fundamentals_spec() -> SubAgentSpec:
-    prompt_def = SYSTEM_PROMPTS["fundamental_data"]
-    return SubAgentSpec(
-        name="fundamental_data",
-        description="Company financial statements, earnings data, and corporate event calendars",
-        prompt=prompt_def["prompt"],
-        output_format=prompt_def["output_format"],
-        tools=[
-            ToolBinding("COMPANY_OVERVIEW", "Company information, financial ratios, and metrics"),
-            ToolBinding("INCOME_STATEMENT", "Annual and quarterly income statements"),
-            ToolBinding("BALANCE_SHEET", "Annual and quarterly balance sheets"),
-            ToolBinding("CASH_FLOW", "Annual and quarterly cash flow statements"),
-            ToolBinding("EARNINGS", "Annual and quarterly earnings data"),
-            ToolBinding("LISTING_STATUS", "Listing and delisting data for equities"),
-            ToolBinding("EARNINGS_CALENDAR", "Earnings calendar for upcoming earnings"),
-            ToolBinding("IPO_CALENDAR", "Initial public offering calendar"),
-        ],
-        group="market_data",
-    )
+_prompt_def = prompt_definition("fundamental_data")
+
+SPEC = SubAgentSpec(
+    name="fundamental_data",
+    description="Company financial statements, earnings data, and corporate event calendars",
+    prompt=_prompt_def["prompt"],
+    output_format=_prompt_def["output_format"],
+    tools=(
+        tool_binding("COMPANY_OVERVIEW", "Company information, financial ratios, and metrics"),
+        tool_binding("INCOME_STATEMENT", "Annual and quarterly income statements"),
+        tool_binding("BALANCE_SHEET", "Annual and quarterly balance sheets"),
+        tool_binding("CASH_FLOW", "Annual and quarterly cash flow statements"),
+        tool_binding("EARNINGS", "Annual and quarterly earnings data"),
+        tool_binding("LISTING_STATUS", "Listing and delisting data for equities"),
+        tool_binding("EARNINGS_CALENDAR", "Earnings calendar for upcoming earnings"),
+        tool_binding("IPO_CALENDAR", "Initial public offering calendar"),
+    ),
+    group="market_data",
+)
@@ -1,18 +1,16 @@
-from kratos.subagents.registry import SubAgentSpec, ToolBinding, register_subagent
-from kratos.subagents.system_prompts import SYSTEM_PROMPTS
+from kratos.subagents.registry import SubAgentSpec, prompt_definition, tool_binding
 
 
-@register_subagent
-def search_spec() -> SubAgentSpec:
-    prompt_def = SYSTEM_PROMPTS["search_web"]
-    return SubAgentSpec(
-        name="search_web",
-        description="Web search specialist for gathering market context, macro news, and corroborating data points.",
-        prompt=prompt_def["prompt"],
-        output_format=prompt_def["output_format"],
-        tools=[
-            ToolBinding("search_web", "Used to run web search"),
-            ToolBinding("search_news", "Used to run news-oriented search"),
-        ],
-        group="utilities",
-    )
+_prompt_def = prompt_definition("search_web")
+
+SPEC = SubAgentSpec(
+    name="search_web",
+    description="Web search specialist for gathering market context, macro news, and corroborating data points.",
+    prompt=_prompt_def["prompt"],
+    output_format=_prompt_def["output_format"],
+    tools=(
+        tool_binding("search_web", "Used to run web search"),
+        tool_binding("search_news", "Used to run news-oriented search"),
+    ),
+    group="utilities",
+)
@@ -1,69 +1,67 @@
-from kratos.subagents.registry import SubAgentSpec, ToolBinding, register_subagent
-from kratos.subagents.system_prompts import SYSTEM_PROMPTS
+from kratos.subagents.registry import SubAgentSpec, prompt_definition, tool_binding
 
 
-@register_subagent
-def technicals_spec() -> SubAgentSpec:
-    prompt_def = SYSTEM_PROMPTS["technical_indicators"]
-    return SubAgentSpec(
-        name="technical_indicators",
-        description="Comprehensive technical analysis indicators including moving averages, oscillators, momentum, volatility, and volume indicators",
-        prompt=prompt_def["prompt"],
-        output_format=prompt_def["output_format"],
-        tools=[
-            ToolBinding("SMA", "Simple moving average (SMA) values"),
-            ToolBinding("EMA", "Exponential moving average (EMA) values"),
-            ToolBinding("WMA", "Weighted moving average (WMA) values"),
-            ToolBinding("DEMA", "Double exponential moving average (DEMA) values"),
-            ToolBinding("TEMA", "Triple exponential moving average (TEMA) values"),
-            ToolBinding("TRIMA", "Triangular moving average (TRIMA) values"),
-            ToolBinding("KAMA", "Kaufman adaptive moving average (KAMA) values"),
-            ToolBinding("MAMA", "MESA adaptive moving average (MAMA) values"),
-            ToolBinding("VWAP", "Volume weighted average price (VWAP) for intraday time series"),
-            ToolBinding("T3", "Triple exponential moving average (T3) values"),
-            ToolBinding("MACD", "Moving average convergence / divergence (MACD) values"),
-            ToolBinding("MACDEXT", "Moving average convergence / divergence values with controllable moving average type"),
-            ToolBinding("STOCH", "Stochastic oscillator (STOCH) values"),
-            ToolBinding("STOCHF", "Stochastic fast (STOCHF) values"),
-            ToolBinding("RSI", "Relative strength index (RSI) values"),
-            ToolBinding("STOCHRSI", "Stochastic relative strength index (STOCHRSI) values"),
-            ToolBinding("WILLR", "Williams' %R (WILLR) values"),
-            ToolBinding("ADX", "Average directional movement index (ADX) values"),
-            ToolBinding("ADXR", "Average directional movement index rating (ADXR) values"),
-            ToolBinding("APO", "Absolute price oscillator (APO) values"),
-            ToolBinding("PPO", "Percentage price oscillator (PPO) values"),
-            ToolBinding("MOM", "Momentum (MOM) values"),
-            ToolBinding("BOP", "Balance of power (BOP) values"),
-            ToolBinding("CCI", "Commodity channel index (CCI) values"),
-            ToolBinding("CMO", "Chande momentum oscillator (CMO) values"),
-            ToolBinding("ROC", "Rate of change (ROC) values"),
-            ToolBinding("ROCR", "Rate of change ratio (ROCR) values"),
-            ToolBinding("AROON", "Aroon (AROON) values"),
-            ToolBinding("AROONOSC", "Aroon oscillator (AROONOSC) values"),
-            ToolBinding("MFI", "Money flow index (MFI) values"),
-            ToolBinding("TRIX", "1-day rate of change of a triple smooth exponential moving average (TRIX) values"),
-            ToolBinding("ULTOSC", "Ultimate oscillator (ULTOSC) values"),
-            ToolBinding("DX", "Directional movement index (DX) values"),
-            ToolBinding("MINUS_DI", "Minus directional indicator (MINUS_DI) values"),
-            ToolBinding("PLUS_DI", "Plus directional indicator (PLUS_DI) values"),
-            ToolBinding("MINUS_DM", "Minus directional movement (MINUS_DM) values"),
-            ToolBinding("PLUS_DM", "Plus directional movement (PLUS_DM) values"),
-            ToolBinding("BBANDS", "Bollinger bands (BBANDS) values"),
-            ToolBinding("MIDPOINT", "Midpoint values - (highest value + lowest value)/2"),
-            ToolBinding("MIDPRICE", "Midpoint price values - (highest high + lowest low)/2"),
-            ToolBinding("SAR", "Parabolic SAR (SAR) values"),
-            ToolBinding("TRANGE", "True range (TRANGE) values"),
-            ToolBinding("ATR", "Average true range (ATR) values"),
-            ToolBinding("NATR", "Normalized average true range (NATR) values"),
-            ToolBinding("AD", "Chaikin A/D line (AD) values"),
-            ToolBinding("ADOSC", "Chaikin A/D oscillator (ADOSC) values"),
-            ToolBinding("OBV", "On balance volume (OBV) values"),
-            ToolBinding("HT_TRENDLINE", "Hilbert transform, instantaneous trendline (HT_TRENDLINE) values"),
-            ToolBinding("HT_SINE", "Hilbert transform, sine wave (HT_SINE) values"),
-            ToolBinding("HT_TRENDMODE", "Hilbert transform, trend vs cycle mode (HT_TRENDMODE) values"),
-            ToolBinding("HT_DCPERIOD", "Hilbert transform, dominant cycle period (HT_DCPERIOD) values"),
-            ToolBinding("HT_DCPHASE", "Hilbert transform, dominant cycle phase (HT_DCPHASE) values"),
-            ToolBinding("HT_PHASOR", "Hilbert transform, phasor components (HT_PHASOR) values"),
-        ],
-        group="technical",
-    )
+_prompt_def = prompt_definition("technical_indicators")
+
+SPEC = SubAgentSpec(
+    name="technical_indicators",
+    description="Comprehensive technical analysis indicators including moving averages, oscillators, momentum, volatility, and volume indicators",
+    prompt=_prompt_def["prompt"],
+    output_format=_prompt_def["output_format"],
+    tools=(
+        tool_binding("SMA", "Simple moving average (SMA) values"),
+        tool_binding("EMA", "Exponential moving average (EMA) values"),
+        tool_binding("WMA", "Weighted moving average (WMA) values"),
+        tool_binding("DEMA", "Double exponential moving average (DEMA) values"),
+        tool_binding("TEMA", "Triple exponential moving average (TEMA) values"),
+        tool_binding("TRIMA", "Triangular moving average (TRIMA) values"),
+        tool_binding("KAMA", "Kaufman adaptive moving average (KAMA) values"),
+        tool_binding("MAMA", "MESA adaptive moving average (MAMA) values"),
+        tool_binding("VWAP", "Volume weighted average price (VWAP) for intraday time series"),
+        tool_binding("T3", "Triple exponential moving average (T3) values"),
+        tool_binding("MACD", "Moving average convergence / divergence (MACD) values"),
+        tool_binding("MACDEXT", "Moving average convergence / divergence values with controllable moving average type"),
+        tool_binding("STOCH", "Stochastic oscillator (STOCH) values"),
+        tool_binding("STOCHF", "Stochastic fast (STOCHF) values"),
+        tool_binding("RSI", "Relative strength index (RSI) values"),
+        tool_binding("STOCHRSI", "Stochastic relative strength index (STOCHRSI) values"),
+        tool_binding("WILLR", "Williams' %R (WILLR) values"),
+        tool_binding("ADX", "Average directional movement index (ADX) values"),
+        tool_binding("ADXR", "Average directional movement index rating (ADXR) values"),
+        tool_binding("APO", "Absolute price oscillator (APO) values"),
+        tool_binding("PPO", "Percentage price oscillator (PPO) values"),
+        tool_binding("MOM", "Momentum (MOM) values"),
+        tool_binding("BOP", "Balance of power (BOP) values"),
+        tool_binding("CCI", "Commodity channel index (CCI) values"),
+        tool_binding("CMO", "Chande momentum oscillator (CMO) values"),
+        tool_binding("ROC", "Rate of change (ROC) values"),
+        tool_binding("ROCR", "Rate of change ratio (ROCR) values"),
+        tool_binding("AROON", "Aroon (AROON) values"),
+        tool_binding("AROONOSC", "Aroon oscillator (AROONOSC) values"),
+        tool_binding("MFI", "Money flow index (MFI) values"),
+        tool_binding("TRIX", "1-day rate of change of a triple smooth exponential moving average (TRIX) values"),
+        tool_binding("ULTOSC", "Ultimate oscillator (ULTOSC) values"),
+        tool_binding("DX", "Directional movement index (DX) values"),
+        tool_binding("MINUS_DI", "Minus directional indicator (MINUS_DI) values"),
+        tool_binding("PLUS_DI", "Plus directional indicator (PLUS_DI) values"),
+        tool_binding("MINUS_DM", "Minus directional movement (MINUS_DM) values"),
+        tool_binding("PLUS_DM", "Plus directional movement (PLUS_DM) values"),
+        tool_binding("BBANDS", "Bollinger bands (BBANDS) values"),
+        tool_binding("MIDPOINT", "Midpoint values - (highest value + lowest value)/2"),
+        tool_binding("MIDPRICE", "Midpoint price values - (highest high + lowest low)/2"),
+        tool_binding("SAR", "Parabolic SAR (SAR) values"),
+        tool_binding("TRANGE", "True range (TRANGE) values"),
+        tool_binding("ATR", "Average true range (ATR) values"),
+        tool_binding("NATR", "Normalized average true range (NATR) values"),
+        tool_binding("AD", "Chaikin A/D line (AD) values"),
+        tool_binding("ADOSC", "Chaikin A/D oscillator (ADOSC) values"),
+        tool_binding("OBV", "On balance volume (OBV) values"),
+        tool_binding("HT_TRENDLINE", "Hilbert transform, instantaneous trendline (HT_TRENDLINE) values"),
+        tool_binding("HT_SINE", "Hilbert transform, sine wave (HT_SINE) values"),
+        tool_binding("HT_TRENDMODE", "Hilbert transform, trend vs cycle mode (HT_TRENDMODE) values"),
+        tool_binding("HT_DCPERIOD", "Hilbert transform, dominant cycle period (HT_DCPERIOD) values"),
+        tool_binding("HT_DCPHASE", "Hilbert transform, dominant cycle phase (HT_DCPHASE) values"),
+        tool_binding("HT_PHASOR", "Hilbert transform, phasor components (HT_PHASOR) values"),
+    ),
+    group="technical",
+)
@@ -1,549 +1,324 @@
 """
 System prompts configuration for Alpha Vantage subagents.
 Each prompt includes the agent's role and output format specifications.
+Prompt bodies live in ``prompts/<agent>.md`` and are read on first access.
 """
 
+import re
+import sys
+import textwrap
+from collections.abc import Mapping
+from dataclasses import asdict, dataclass
+from enum import StrEnum
+from functools import lru_cache
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Dict, Tuple
 
+_PROMPT_DIR = Path(__file__).with_name("prompts")
 
+# Placeholder for a prompt body that is loaded from ``_PROMPT_DIR``.
+_LAZY = object()
 
-SYSTEM_PROMPTS = {
-    "core_stock_apis": {
-    "prompt": "You are a Stock Market Data Specialist Agent responsible for retrieving, analyzing, and presenting stock market data using the Alpha Vantage APIs. You can access real-time quotes, historical OHLCV data (spanning 20+ years), and symbol metadata across multiple timeframes — including intraday, daily, weekly, and monthly. When a user requests stock data, infer the appropriate time series interval, fetch the data, and deliver a clear, data-driven analysis. Always use adjusted data when available to account for dividends and stock splits. Include technical insights (e.g., SMA, EMA, RSI, MACD) when beneficial and summarize trends, key levels, and actionable signals. Format responses concisely, with clear takeaways suitable for general readers.",
-    
-    "output_format": {
-        "type": "flexible",
-        "options": [
-            {
-                "format": "consolidated_report",
-                "description": "A comprehensive stock analysis report including historical trends, current performance, and actionable insights."
-            },
-            {
-                "format": "report_with_instructions",
-                "description": "A consolidated report accompanied by instructions for the master agent (e.g., to trigger deeper sector analysis, sentiment correlation, or comparison with peer symbols)."
-            },
-            {
-                "format": "report_with_files",
-                "description": "A consolidated report with attached CSV/JSON files containing raw or processed data. Includes guidance to invoke a codeact agent for further computations, technical indicator derivation, or chart generation."
-            },
-            {
-                "format": "report_with_files_and_instructions",
-                "description": "A comprehensive report that includes output files and detailed follow-up instructions for downstream agents, covering deeper analytics or visualization tasks."
-            }
-        ]
-        }
-    },
-
-    "options_data_apis": {
-        "prompt": "You are an options market data analyst. Your expertise is in retrieving and interpreting options chain data, Greeks, and historical options information for US equities. When users request options data, fetch the complete options chain with calculated Greeks (delta, gamma, theta, vega, rho) and provide insights on implied volatility, strike prices, and expiration dates. Support both real-time and historical analysis spanning 15+ years.",
-        "output_format": {
-            "type": "flexible",
-            "options": [
-                {
-                    "format": "consolidated_report",
-                    "description": "Options analysis report with Greeks interpretation and trading insights"
-                },
-                {
-                    "format": "report_with_instructions",
-                    "description": "Options analysis with instructions for risk assessment or strategy evaluation"
-                },
-                {
-                    "format": "report_with_files",
-                    "description": "Options data exported to files with instructions to call codeact agent for processing (e.g., calculating custom Greeks, volatility surfaces, options strategies backtesting)"
-                },
-                {
-                    "format": "report_with_files_and_instructions",
-                    "description": "Complete options analysis with data files and processing instructions for advanced analytics"
-                }
-            ]
-        }
-    },
-
-    "alpha_intelligence": {
-        "prompt": "You are a market intelligence analyst specializing in news sentiment, earnings analysis, and insider trading patterns. Your tools provide access to live market news with AI-powered sentiment scoring, earnings call transcripts with LLM-generated insights, real-time market movers (top gainers, losers, most active), insider transaction tracking, and advanced analytics over both fixed and sliding time windows. When analyzing market events, synthesize multiple data sources to provide comprehensive intelligence reports that identify trends, anomalies, and trading signals.",
-        "output_format": {
-            "type": "flexible",
-            "options": [
-                {
-                    "format": "consolidated_report",
-                    "description": "Market intelligence report with sentiment analysis and identified trends"
-                },
-                {
-                    "format": "report_with_instructions",
-                    "description": "Intelligence report with recommendations for master agent on further investigation areas"
-                },
-                {
-                    "format": "report_with_files",
-                    "description": "Raw sentiment data, insider transactions, or market movers exported to files with instructions for codeact agent to perform correlation analysis, pattern recognition, or anomaly detection"
-                },
-                {
-                    "format": "report_with_files_and_instructions",
-                    "description": "Comprehensive intelligence package with datasets and detailed processing instructions for quantitative analysis"
-                }
-            ]
-        }
-    },
-
-    "fundamental_data": {
-        "prompt": "You are a fundamental analysis expert. Your role is to retrieve and analyze company financial data including income statements, balance sheets, cash flow statements, earnings reports, and company overviews with key financial ratios. You also track corporate events through earnings and IPO calendars. When analyzing companies, assess financial health using multiple statements, calculate key metrics (P/E, ROE, debt ratios, growth rates), and provide comparative analysis across reporting periods. Present findings in a structured format suitable for investment decisions.",
-        "output_format": {
-            "type": "flexible",
-            "options": [
-                {
-                    "format": "consolidated_report",
-                    "description": "Fundamental analysis report with financial health assessment and key metrics"
-                },
-                {
-                    "format": "report_with_instructions",
-                    "description": "Financial analysis with instructions for peer comparison or sector analysis"
-                },
-                {
-                    "format": "report_with_files",
-                    "description": "Financial statements exported to files with instructions for codeact agent to calculate custom ratios, perform trend analysis, or build valuation models"
-                },
-                {
-                    "format": "report_with_files_and_instructions",
-                    "description": "Complete fundamental analysis package with financial data files and instructions for DCF modeling, ratio analysis, or multi-company comparisons"
-                }
-            ]
-        }
-    },
-
-    "forex": {
-        "prompt": "You are a forex market specialist. Your tools provide foreign exchange rate data across intraday, daily, weekly, and monthly intervals for currency pairs worldwide. When users request FX data, determine the appropriate currency pair and timeframe, retrieve the exchange rate history, and identify trends, support/resistance levels, and volatility patterns. Support analysis for major, minor, and exotic currency pairs.",
-        "output_format": {
-            "type": "flexible",
-            "options": [
-                {
-                    "format": "consolidated_report",
-                    "description": "Forex analysis report with trend identification and key levels"
-                },
-                {
-                    "format": "report_with_instructions",
-                    "description": "FX analysis with instructions for cross-pair correlation or carry trade analysis"
-                },
-                {
-                    "format": "report_with_files",
-                    "description": "Exchange rate data exported to files with instructions for codeact agent to calculate volatility metrics, perform correlation analysis, or identify arbitrage opportunities"
-                },
-                {
-                    "format": "report_with_files_and_instructions",
-                    "description": "Comprehensive forex package with historical data and instructions for technical analysis or risk modeling"
-                }
-            ]
-        }
-    },
-
-    "cryptocurrencies": {
-        "prompt": "You are a cryptocurrency market analyst. Your tools provide real-time exchange rates and historical time series data for digital currencies across intraday, daily, weekly, and monthly intervals. When analyzing crypto markets, retrieve pricing data for major cryptocurrencies (Bitcoin, Ethereum, etc.) against both fiat and crypto pairs, identify market trends, calculate volatility metrics, and track price movements across different timeframes. Present data in both crypto-to-crypto and crypto-to-fiat formats.",
-        "output_format": {
-            "type": "flexible",
-            "options": [
-                {
-                    "format": "consolidated_report",
-                    "description": "Cryptocurrency analysis report with trend and volatility assessment"
-                },
-                {
-                    "format": "report_with_instructions",
-                    "description": "Crypto analysis with instructions for cross-exchange arbitrage or correlation studies"
-                },
-                {
-                    "format": "report_with_files",
-                    "description": "Cryptocurrency price data exported to files with instructions for codeact agent to calculate on-chain metrics correlation, volatility modeling, or price prediction features"
-                },
-                {
-                    "format": "report_with_files_and_instructions",
-                    "description": "Complete crypto analysis package with historical data and instructions for quantitative modeling or portfolio optimization"
-                }
-            ]
-        }
-    },
-
-    "commodities": {
-        "prompt": "You are a commodities market expert. Your tools provide global pricing data for energy commodities (WTI crude oil, Brent crude, natural gas), industrial metals (copper, aluminum), and agricultural products (wheat, corn, cotton, sugar, coffee). When users request commodity data, fetch the relevant prices, analyze historical trends, identify seasonal patterns, and correlate movements across related commodities. Support both individual commodity analysis and cross-commodity comparisons.",
-        "output_format": {
-            "type": "flexible",
-            "options": [
-                {
-                    "format": "consolidated_report",
-                    "description": "Commodities analysis report with trend and seasonality insights"
-                },
-                {
-                    "format": "report_with_instructions",
-                    "description": "Commodity analysis with instructions for spread trading or supply-demand modeling"
-                },
-                {
-                    "format": "report_with_files",
-                    "description": "Commodity price data exported to files with instructions for codeact agent to perform seasonality analysis, correlation studies, or contango/backwardation calculations"
-                },
-                {
-                    "format": "report_with_files_and_instructions",
-                    "description": "Comprehensive commodities package with pricing data and instructions for cross-commodity analysis or hedging strategies"
-                }
-            ]
-        }
-    },
-
-    "economic_indicators": {
-        "prompt": "You are a macroeconomic data analyst. Your tools provide access to critical economic indicators including GDP metrics, treasury yields, federal funds rate, inflation (CPI), retail sales, durable goods orders, unemployment rate, and non-farm payroll data. When analyzing economic conditions, retrieve relevant indicators, identify trends in economic growth, inflation, employment, and monetary policy. Correlate multiple indicators to assess overall economic health and provide context for market movements.",
-        "output_format": {
-            "type": "flexible",
-            "options": [
-                {
-                    "format": "consolidated_report",
-                    "description": "Economic analysis report with indicator trends and policy implications"
-                },
-                {
-                    "format": "report_with_instructions",
-                    "description": "Economic analysis with instructions for sector impact assessment or policy scenario modeling"
-                },
-                {
-                    "format": "report_with_files",
-                    "description": "Economic indicator data exported to files with instructions for codeact agent to perform regression analysis, leading indicator calculations, or recession probability modeling"
-                },
-                {
-                    "format": "report_with_files_and_instructions",
-                    "description": "Complete economic analysis package with indicator data and instructions for econometric modeling or policy impact analysis"
-                }
-            ]
-        }
-    },
-
-    "technical_indicators": {
-    "prompt": """
-You are an expert in technical analysis for equities and options. Your primary goal is to make user money. You will use best tools at your disposal. Alwasy revaluate if more tools are needed to come to a conclusion.
-
-**Your Goal:** To conduct a comprehensive technical analysis based on the user's request.
-
-**Your Process:**
-1.  **Analyze Strategy:** First, understand the user's goal or trading strategy (e.g., directional, volatility, income).
-2.  **Select Tools:** Choose the *most relevant* technical indicators from the **Technical Indicators Tools Reference** below. Do not use any indicators not in that reference.
-3.  **Perform Multi-Timeframe Analysis:** Compute indicator values across multiple timeframes (e.g., intraday, daily, weekly) to capture the full market dynamics.
-4.  **Find Confluence:** **This is critical.** Do not rely on a single indicator. Cross-validate signals from *different* indicator categories (e.g., confirm a Trend signal with a Momentum or Volume indicator) to enhance signal reliability and avoid false positives ("whipsaws").
-5.  **Deliver Actionable Insights:** Provide a clear, professional report that includes:
-    * Entry and exit signals.
-    * Key support and resistance levels.
-    * Trend strength, persistence, or reversal signals.
-    * Risk management recommendations (e.g., stop-loss thresholds).
-        
-## 📈 Technical Indicators Tools Reference
-
-### 🔹 Trend Indicators
-| **Tool** | **Description** | **Tool** | **Description** |
-|-----------|-----------------|-----------|-----------------|
-| SMA | Simple moving average (SMA) values | EMA | Exponential moving average (EMA) values |
-| WMA | Weighted moving average (WMA) values | DEMA | Double exponential moving average (DEMA) values |
-| TEMA | Triple exponential moving average (TEMA) values | TRIMA | Triangular moving average (TRIMA) values |
-| KAMA | Kaufman adaptive moving average (KAMA) values | MAMA | MESA adaptive moving average (MAMA) values |
-| T3 | Triple exponential moving average (T3) values | VWAP | Volume weighted average price (VWAP) for intraday time series |
-| HT_TRENDLINE | Hilbert transform, instantaneous trendline (HT_TRENDLINE) values | HT_TRENDMODE | Hilbert transform, trend vs cycle mode (HT_TRENDMODE) values |
-
----
-
-### 🔸 Momentum Indicators
-| **Tool** | **Description** | **Tool** | **Description** |
-|-----------|-----------------|-----------|-----------------|
-| MACD | Moving average convergence / divergence (MACD) values | MACDEXT | MACD with controllable moving average type |
-| RSI | Relative strength index (RSI) values | STOCHRSI | Stochastic relative strength index (STOCHRSI) values |
-| STOCH | Stochastic oscillator (STOCH) values | STOCHF | Stochastic fast (STOCHF) values |
-| WILLR | Williams’ %R (WILLR) values | CCI | Commodity channel index (CCI) values |
-| CMO | Chande momentum oscillator (CMO) values | MOM | Momentum (MOM) values |
-| ROC | Rate of change (ROC) values | ROCR | Rate of change ratio (ROCR) values |
-| APO | Absolute price oscillator (APO) values | PPO | Percentage price oscillator (PPO) values |
-| TRIX | 1-day rate of change of a triple smooth exponential moving average | ULTOSC | Ultimate oscillator (ULTOSC) values |
-
----
-
-### 🔶 Directional Indicators
-| **Tool** | **Description** | **Tool** | **Description** |
-|-----------|-----------------|-----------|-----------------|
-| ADX | Average directional movement index (ADX) values | ADXR | Average directional movement index rating (ADXR) values |
-| DX | Directional movement index (DX) values | AROON | Aroon (AROON) values |
-| AROONOSC | Aroon oscillator (AROONOSC) values | PLUS_DI | Plus directional indicator (PLUS_DI) values |
-| MINUS_DI | Minus directional indicator (MINUS_DI) values | PLUS_DM | Plus directional movement (PLUS_DM) values |
-| MINUS_DM | Minus directional movement (MINUS_DM) values | BOP | Balance of power (BOP) values |
-
----
-
-### 🔷 Volatility Indicators
-| **Tool** | **Description** | **Tool** | **Description** |
-|-----------|-----------------|-----------|-----------------|
-| BBANDS | Bollinger bands (BBANDS) values | ATR | Average true range (ATR) values |
-| NATR | Normalized average true range (NATR) values | TRANGE | True range (TRANGE) values |
-| MIDPOINT | Midpoint – (highest + lowest) / 2 | MIDPRICE | Midpoint price – (highest high + lowest low) / 2 |
-| SAR | Parabolic SAR (SAR) values | — | — |
-
----
-
-### 🟢 Volume-Based Indicators
-| **Tool** | **Description** | **Tool** | **Description** |
-|-----------|-----------------|-----------|-----------------|
-| AD | Chaikin A/D line (AD) values | ADOSC | Chaikin A/D oscillator (ADOSC) values |
-| OBV | On balance volume (OBV) values | MFI | Money flow index (MFI) values |
-
----
-
-### 🌀 Cycle Indicators
-| **Tool** | **Description** | **Tool** | **Description** |
-|-----------|-----------------|-----------|-----------------|
-| HT_SINE | Hilbert transform, sine wave (HT_SINE) values | HT_DCPERIOD | Hilbert transform, dominant cycle period (HT_DCPERIOD) values |
-| HT_DCPHASE | Hilbert transform, dominant cycle phase (HT_DCPHASE) values | HT_PHASOR | Hilbert transform, phasor components (HT_PHASOR) values |
-
-
-""",
-    "output_format": {
-      "type": "flexible",
-      "options": [
-        {
-          "format": "consolidated_report",
-          "description": "Technical analysis report with signals and trading recommendations"
-        },
-        {
-          "format": "report_with_instructions",
-          "description": "Technical analysis with instructions for multi-timeframe confirmation or divergence studies"
-        },
-        {
-          "format": "report_with_files",
-          "description": "Technical indicator data exported to files with instructions for codeact agent to perform backtesting, signal optimization, or custom indicator development (e.g., processing MACD, SMA, RSI files for strategy testing)"
-        },
-        {
-          "format": "report_with_files_and_instructions",
-          "description": "Complete technical analysis package with indicator data files and instructions for strategy backtesting, parameter optimization, or machine learning feature engineering"
-        }
-      ]
-    }
-  },
-  
-    "codeact":{
-        "prompt": """
-## 🧠 Agent Definition — Explainable Python Analyst
 
-You are an **Explainable Python Analyst**, a specialized agent responsible for **writing, executing, and explaining Python-based financial analyses** using tools made available in the runtime environment.
+_TRAILING_WS = re.compile(r"[ \t]+\n")
+_BLANK_RUNS = re.compile(r"\n{3,}")
 
-Your purpose is to generate **clear analytical insights**, **visualizations**, and **reports** for integration into professional financial research.
 
----
+def _normalize(text: str) -> str:
+    """Drop indentation, trailing spaces and blank-line runs that only cost tokens."""
+    text = textwrap.dedent(text).strip()
+    text = _TRAILING_WS.sub("\n", text)
+    return _BLANK_RUNS.sub("\n\n", text)
 
-### 🧰 Available Tools
 
-1. **get_session_summary**: This tool will give the entire session summary that is needed. **Important** THIS TOOL Should be run first and then generate code based on this results. Results includes Context Data Locations with
-  
-  - relative_path : used by tools
-    
-  - absolute_path: to be used by Language Model in the code that has to be generated.
-    
+@lru_cache(maxsize=None)
+def get_prompt(name: str) -> str:
+    """Return the normalized prompt body for agent ``name``, reading it from disk once."""
+    return _normalize((_PROMPT_DIR / f"{name}.md").read_text(encoding="utf-8"))
 
-```python
-# Example
-data_dir = ./vault/sessions/1213423.3443/data
 
-aapl_data = pd.read_csv(f'{data_dir}/AAPL_daily_data_3mo.csv', parse_dates=['Date'])
-```
+class _PromptEntry(Mapping):
+    """Read-only agent entry that resolves its ``prompt`` body lazily."""
 
-2. **write_file**
-  
+    __slots__ = ("_name", "_data")
 
-- **Description:**
+    def __init__(self, name, data):
+        self._name = name
+        self._data = data
 
-Creates or overwrites Python files used for analysis.
+    def __getitem__(self, key):
+        value = self._data[key]
+        if value is _LAZY:
+            return get_prompt(self._name)
+        return value
 
-- **Usage Convention:**
+    def __iter__(self):
+        return iter(self._data)
 
-Save analysis scripts to:
+    def __len__(self):
+        return len(self._data)
 
-```
-# Example to use relative_path
-write_file("/code/<pythonfile_name>", "<python_code>")
 
-write_file("/code/analysis.py","print('hello world')")
-```
+_OPTION_POOL = {}
 
-3. **session_code_executor**
-  
 
-- **Description:**
+def _option(format, description):
+    """Return the shared read-only option for ``(format, description)``.
 
-Executes Python scripts created with `write_file` and returns their results or errors.
+    Only the short ``format`` tag is interned; descriptions are opaque text.
+    """
+    key = (sys.intern(format), description)
+    option = _OPTION_POOL.get(key)
+    if option is None:
+        option = _OPTION_POOL[key] = MappingProxyType(
+            {"format": key[0], "description": key[1]}
+        )
+    return option
 
-- **Usage**
 
-```
-session_code_executor(<pythonfilename>,<code location from get_session_summary tool call>)
+_FLEXIBLE_FORMATS = (
+    "consolidated_report",
+    "report_with_instructions",
+    "report_with_files",
+    "report_with_files_and_instructions",
+)
 
-session_code_executor("analysis.py",".vault/sessions/234324/code")
-```
 
-- **Error Handling:**
-
-Automatically detect, fix, and rerun code upon encountering execution errors.
-
-4. **pwd**
-  
-
-- **Description:**
-
-Returns the current working directory, useful for relative path resolution.
+def _flexible(*descriptions):
+    """Build the four-option flexible output format from per-agent descriptions."""
+    return MappingProxyType({
+        "type": "flexible",
+        "options": tuple(
+            _option(format, description)
+            for format, description in zip(_FLEXIBLE_FORMATS, descriptions, strict=True)
+        ),
+    })
 
----
 
-### 🎯 Primary Directive — Explainability
+# Shared by technical_indicators and search_web, so the wording stays domain-neutral.
+_GENERIC_OUTPUT_FORMAT = _flexible(
+    "Analysis report with key findings, signals, and recommendations",
+    "Analysis report with instructions for the master agent on follow-up research, confirmation, or divergence studies",
+    "Collected data exported to files with instructions for codeact agent to perform further processing, backtesting, or custom analysis (e.g., processing indicator or search result files)",
+    "Complete analysis package with data files and instructions for downstream processing, strategy backtesting, modeling, or visualization",
+)
 
-Your **final message** to the master (Finance Agent) must be a **structured, human-readable analytical report** divided into **four sections**:
 
-1. **What You Did**
+SYSTEM_PROMPTS = {
+    "core_stock_apis": {
+    "prompt": _LAZY,
+    
+    "output_format": _flexible(
+        "A comprehensive stock analysis report including historical trends, current performance, and actionable insights.",
+        "A consolidated report accompanied by instructions for the master agent (e.g., to trigger deeper sector analysis, sentiment correlation, or comparison with peer symbols).",
+        "A consolidated report with attached CSV/JSON files containing raw or processed data. Includes guidance to invoke a codeact agent for further computations, technical indicator derivation, or chart generation.",
+        "A comprehensive report that includes output files and detailed follow-up instructions for downstream agents, covering deeper analytics or visualization tasks.",
+    )
+    },
 
-Describe the analytical steps taken (e.g., data loaded, computations performed).
+    "options_data_apis": {
+        "prompt": _LAZY,
+        "output_format": _flexible(
+            "Options analysis report with Greeks interpretation and trading insights",
+            "Options analysis with instructions for risk assessment or strategy evaluation",
+            "Options data exported to files with instructions to call codeact agent for processing (e.g., calculating custom Greeks, volatility surfaces, options strategies backtesting)",
+            "Complete options analysis with data files and processing instructions for advanced analytics",
+        )
+    },
 
-2. **How You Did It**
+    "alpha_intelligence": {
+        "prompt": _LAZY,
+        "output_format": _flexible(
+            "Market intelligence report with sentiment analysis and identified trends",
+            "Intelligence report with recommendations for master agent on further investigation areas",
+            "Raw sentiment data, insider transactions, or market movers exported to files with instructions for codeact agent to perform correlation analysis, pattern recognition, or anomaly detection",
+            "Comprehensive intelligence package with datasets and detailed processing instructions for quantitative analysis",
+        )
+    },
 
-Detail the methods, libraries, and logic used.
+    "fundamental_data": {
+        "prompt": _LAZY,
+        "output_format": _flexible(
+            "Fundamental analysis report with financial health assessment and key metrics",
+            "Financial analysis with instructions for peer comparison or sector analysis",
+            "Financial statements exported to files with instructions for codeact agent to calculate custom ratios, perform trend analysis, or build valuation models",
+            "Complete fundamental analysis package with financial data files and instructions for DCF modeling, ratio analysis, or multi-company comparisons",
+        )
+    },
 
-3. **What It Means**
+    "forex": {
+        "prompt": _LAZY,
+        "output_format": _flexible(
+            "Forex analysis report with trend identification and key levels",
+            "FX analysis with instructions for cross-pair correlation or carry trade analysis",
+            "Exchange rate data exported to files with instructions for codeact agent to calculate volatility metrics, perform correlation analysis, or identify arbitrage opportunities",
+            "Comprehensive forex package with historical data and instructions for technical analysis or risk modeling",
+        )
+    },
 
-Interpret the results in plain, financial-research-relevant language.
+    "cryptocurrencies": {
+        "prompt": _LAZY,
+        "output_format": _flexible(
+            "Cryptocurrency analysis report with trend and volatility assessment",
+            "Crypto analysis with instructions for cross-exchange arbitrage or correlation studies",
+            "Cryptocurrency price data exported to files with instructions for codeact agent to calculate on-chain metrics correlation, volatility modeling, or price prediction features",
+            "Complete crypto analysis package with historical data and instructions for quantitative modeling or portfolio optimization",
+        )
+    },
 
-4. **Where to Find Results**
+    "commodities": {
+        "prompt": _LAZY,
+        "output_format": _flexible(
+            "Commodities analysis report with trend and seasonality insights",
+            "Commodity analysis with instructions for spread trading or supply-demand modeling",
+            "Commodity price data exported to files with instructions for codeact agent to perform seasonality analysis, correlation studies, or contango/backwardation calculations",
+            "Comprehensive commodities package with pricing data and instructions for cross-commodity analysis or hedging strategies",
+        )
+    },
 
-Provide **absolute paths** for all output artifacts (charts, reports, etc.).
+    "economic_indicators": {
+        "prompt": _LAZY,
+        "output_format": _flexible(
+            "Economic analysis report with indicator trends and policy implications",
+            "Economic analysis with instructions for sector impact assessment or policy scenario modeling",
+            "Economic indicator data exported to files with instructions for codeact agent to perform regression analysis, leading indicator calculations, or recession probability modeling",
+            "Complete economic analysis package with indicator data and instructions for econometric modeling or policy impact analysis",
+        )
+    },
 
----
+    "technical_indicators": {
+    "prompt": _LAZY,
+    "output_format": _GENERIC_OUTPUT_FORMAT
+  },
+  
+    "codeact":{
+        "prompt": _LAZY,
+        "output_format": {
+            "type": "flexible",
+            "options": (
+                _option(
+                    "consolidated_report",
+                    "An explainable analysis report. This report MUST include the full file paths to any generated charts (e.g., 'session/images/chart.png') or text files.",
+                ),
+                _option(
+                    "report_with_instructions",
+                    "An explainable analysis report with file paths and suggestions for further analysis for the master agent.",
+                ),
+            ),
+        }
+    },
+    "search_web": {
+        "prompt": _LAZY,
+        "output_format": _GENERIC_OUTPUT_FORMAT
+    },
+     "final_report": {
+       "prompt": _LAZY,
+        "output_format": {
+            "type": "rigid",
+            "options": (
+                _option(
+                    "Final Report",
+                    "A single, consolidated HTML/Markdown report integrating all session artifacts (text summaries, table excerpts, chart embeds/references, key metrics) with novice-friendly explanations, logical justifications, and risk-aligned recommendations. Include absolute paths to all non-embedded files for reference.",
+                ),
+            ),
+        }
+    }
+    
+}
 
-### 🧮 Core Behavioral Rules
 
-You will receive:
+def _freeze(table):
+    """Intern agent names and expose the table, output formats included, read-only."""
+    for entry in table.values():
+        output_format = entry["output_format"]
+        if not isinstance(output_format, MappingProxyType):
+            output_format["type"] = sys.intern(output_format["type"])
+            entry["output_format"] = MappingProxyType(output_format)
+    return MappingProxyType(
+        {sys.intern(name): _PromptEntry(name, entry) for name, entry in table.items()}
+    )
 
-- One or more **data file paths** (e.g., CSV, JSON, Parquet).
-  
-- A **specific analytical task** from the Finance Agent.
-  
 
-You must:
+SYSTEM_PROMPTS = _freeze(SYSTEM_PROMPTS)
 
-- Use **`pandas`** (`import pandas as pd`) for all data loading and transformations.
-  
-- Use **`matplotlib.pyplot`** (`import matplotlib.pyplot as plt`) for all charting.
-  
-- Write and execute Python scripts using the provided tools (`write_file`, `session_code_executor`).
-  
-- Debug errors and re-execute automatically until successful completion.
-  
-- Avoid file duplication across retries.
-  
-- Always use **absolute paths** from `get_session_summary` for all inputs and outputs.
-  
-- Likewise when writing/generating a png use absolute location of charts as the location to save to.
-  
+# Closed set of agent names; members are str, so ``SYSTEM_PROMPTS[AgentName.FOREX]``
+# works and callers avoid typo-prone string literals.
+AgentName = StrEnum("AgentName", {name.upper(): name for name in SYSTEM_PROMPTS})
 
----
 
-### ⚙️ Execution Workflow
+@dataclass(frozen=True, slots=True)
+class OutputOption:
+    format: str
+    description: str
 
-1. run `get_session_summary` tool to get the absoute locations from where data should be read in the generated code files.
-  
-2. Write your analysis code to the **Code directory** using `write_file`.
-  
-3. Use get_session_summary() to get the exact code location to run the python file.
-  
-4. Execute the code via `session_code_executor`.
-  
-5. Save charts, reports, and artifacts in their corresponding directories.
-  
-6. Produce a comprehensive **Explainability Report**.
-  
 
----
+@dataclass(frozen=True, slots=True)
+class OutputFormat:
+    type: str
+    options: Tuple[OutputOption, ...]
 
-### 🧾 Final Output Format
 
-Your final message to the master agent must include:
+@dataclass(frozen=True, slots=True)
+class PromptEntry:
+    """Typed view of a ``SYSTEM_PROMPTS`` entry with attribute access."""
 
-1. **Explainability Report** — the four sections (`What`, `How`, `Meaning`, `Where`).
-  
-2. **Key Results or Metrics** — numerical or textual outputs relevant to the task.
-  
-3. **List of Absolute Output Paths** — `.png`, `.txt`, or any generated artifact files.
-  
+    name: str
+    prompt: str
+    output_format: OutputFormat
 
----
+    def as_dict(self) -> Dict[str, Any]:
+        return asdict(self)
 
-### ✅ Example Final Output
 
-**Analysis Report:** MSFT Price Trend
+@lru_cache(maxsize=None)
+def get_entry(name: str) -> PromptEntry:
+    """Return agent ``name``'s entry as a ``PromptEntry``, built once per agent."""
+    entry = SYSTEM_PROMPTS[name]
+    output_format = entry["output_format"]
+    return PromptEntry(
+        name=name,
+        prompt=entry["prompt"],
+        output_format=OutputFormat(
+            type=output_format["type"],
+            options=tuple(
+                OutputOption(option["format"], option["description"])
+                for option in output_format["options"]
+            ),
+        ),
+    )
 
-**What I Did:**
 
-Loaded Microsoft stock price data from `/vault/session123/data/MSFT_prices.json`.
+_CONSTANT_FIELDS = (("_OUTPUT_FORMAT", "output_format"), ("_PROMPT", "prompt"))
 
-**How I Did It:**
 
-Used pandas to compute 50-day and 200-day SMAs, then plotted closing prices and SMAs using matplotlib.
+def __getattr__(name: str):
+    """Resolve ``<AGENT>_PROMPT`` / ``<AGENT>_OUTPUT_FORMAT`` constants on first use.
 
-**What It Means:**
+    The value is bound as a module global, so later lookups skip this hook.
+    """
+    for suffix, key in _CONSTANT_FIELDS:
+        if name.endswith(suffix):
+            entry = SYSTEM_PROMPTS.get(name[: -len(suffix)].lower())
+            if entry is not None:
+                value = globals()[name] = entry[key]
+                return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-The SMA50 crossing above SMA200 indicates a bullish trend.
 
-**Where to Find Results:**
+def __dir__():
+    constants = [
+        f"{agent.upper()}{suffix}" for agent in SYSTEM_PROMPTS for suffix, _ in _CONSTANT_FIELDS
+    ]
+    return [*globals(), *constants]
 
-- Chart: `.vault/session/session123/charts/msft_price_chart.png`
-  
-- Report: `.vault/session/session123/reports/msft_analysis.txt`
- """,
-        "output_format": {
-            "type": "flexible",
-            "options": [
-                {
-                    "format": "consolidated_report",
-                    "description": "An explainable analysis report. This report MUST include the full file paths to any generated charts (e.g., 'session/images/chart.png') or text files."
-                },
-                {
-                    "format": "report_with_instructions",
-                    "description": "An explainable analysis report with file paths and suggestions for further analysis for the master agent."
-                }
-            ]
-        }
-    },
-    "search_web": {
-        "prompt": """
-       You are finance information search agent, your job is to search internet and get answers needed for the main agent to complete its task.
-        """,
-        "output_format": {
-            "type": "flexible",
-            "options": [
-                {
-                    "format": "consolidated_report",
-                    "description": "Technical analysis report with signals and trading recommendations"
-                },
-                {
-                    "format": "report_with_instructions",
-                    "description": "Technical analysis with instructions for multi-timeframe confirmation or divergence studies"
-                },
-                {
-                    "format": "report_with_files",
-                    "description": "Technical indicator data exported to files with instructions for codeact agent to perform backtesting, signal optimization, or custom indicator development (e.g., processing MACD, SMA, RSI files for strategy testing)"
-                },
-                {
-                    "format": "report_with_files_and_instructions",
-                    "description": "Complete technical analysis package with indicator data files and instructions for strategy backtesting, parameter optimization, or machine learning feature engineering"
-                }
-            ]
-        }
-    },
-     "final_report": {
-       "prompt": """
-        You are a final report synthesizer and executive communicator. 
-        Your role is to consolidate all artifacts, analyses, data files, charts, and insights generated by subagents during the session into a single, cohesive final report. This report must be accessible to novices, using plain language, analogies, and step-by-step explanations to demystify complex financial concepts. Draw on the original user query, including any specified risk tolerance (e.g., conservative, moderate, aggressive), to tailor recommendations and ensure balanced, prudent advice. Synthesize findings across domains (e.g., technical signals, fundamental health, market sentiment, economic context) to provide a holistic view, highlighting key trends, risks, opportunities, and actionable insights. Always back arguments with logical reasoning, evidence from artifacts, and cross-references to subagent outputs. Include embedded or referenced visuals (e.g., charts via absolute paths), summaries of quantitative results, and a clear executive summary. Structure the report for readability: start with an overview, dive into core analysis, end with recommendations and caveats. If conflicts arise in subagent data, resolve them transparently with weighted reasoning based on recency, reliability, or relevance.
-        Use absolute paths for charts from get_session_summary or state. 
 
-        References to images should have full path for example bollinger_bands.png is the file. the href should be ../charts/bollinger_bands.png
-        """,
-        "output_format": {
-            "type": "rigid",
-            "options": [
-                {
-                    "format": "Final Report",
-                    "description": "A single, consolidated HTML/Markdown report integrating all session artifacts (text summaries, table excerpts, chart embeds/references, key metrics) with novice-friendly explanations, logical justifications, and risk-aligned recommendations. Include absolute paths to all non-embedded files for reference."
-                }
-            ]
-        }
-    }
-    
-}
+__all__ = [
+    "AgentName",
+    "OutputFormat",
+    "OutputOption",
+    "PromptEntry",
+    "SYSTEM_PROMPTS",
+    "get_entry",
+    "get_prompt",
+]
@@ -7,12 +7,13 @@ LangChain tools whose names mirror the original Alpha Vantage endpoints.
 
 from __future__ import annotations
 
+import sys
 from typing import Any, Callable, Dict, List, Annotated, Optional
 from pydantic import BaseModel, Field
 from langchain.tools import ToolRuntime
 from langchain_core.tools import StructuredTool, InjectedToolArg
 
-from kratos.subagents.agents import ALPHA_VANTAGE_SUBAGENTS
+from kratos.subagents.agents import get_subagents
 from kratos.tools.repl_tools import SESSION_CODE_EXECUTOR
 from kratos.tools.rbase_tool import RMARKDOWN_PDF_EXECUTOR
 from kratos.tools.search_tools import search_news, search_web
@@ -26,10 +27,9 @@ from kratos.tools.fin_tools.forex import HANDLERS as FOREX_HANDLERS
 from kratos.tools.fin_tools.fundamentals import HANDLERS as FUNDAMENTAL_HANDLERS
 from kratos.tools.fin_tools.options import HANDLERS as OPTIONS_HANDLERS
 from kratos.tools.fin_tools.technical import HANDLERS as TECHNICAL_HANDLERS
-from kratos.tools.fin_tools.base import ToolExecutionError
+from kratos.tools.fin_tools.base import ToolExecutionError, dump_json
 
 
-import json
 import os
 import uuid
 
@@ -53,12 +53,13 @@ for handler_set in (
     ECONOMIC_HANDLERS,
     TECHNICAL_HANDLERS,
 ):
-    HANDLER_TABLE.update(handler_set)
+    # Interned keys match the interned tool ids from the subagent specs by identity.
+    HANDLER_TABLE.update((sys.intern(name), handler) for name, handler in handler_set.items())
 
 
 def _build_tool_map() -> Dict[str, str]:
     mapping: Dict[str, str] = {}
-    for category in ALPHA_VANTAGE_SUBAGENTS:
+    for category in get_subagents():
         for tool_meta in category["tools"]:
             mapping[tool_meta["tool"]] = tool_meta["description"]
     return mapping
@@ -84,7 +85,7 @@ def _is_payload_large(result: Dict[str,Any]) -> bool:
         
         # Check for large payload
         threshold = 10000  # tokens
-        json_str = json.dumps(result)
+        json_str = dump_json(result)
         estimated_tokens = len(json_str) // 4  # Rough estimate; refine as needed
         
         if estimated_tokens > threshold:
@@ -134,7 +135,7 @@ def _get_payload(tool_name: str, result: Dict[str, Any], runtime: ToolRuntime) -
 
     # Check for large payload
     threshold = 3000  # tokens
-    json_str = json.dumps(result)
+    json_str = dump_json(result)
     estimated_tokens = len(json_str) // 4  # Rough estimate
 
     print(f"Length {len(json_str)} Estimated Tokens {estimated_tokens}")
@@ -197,6 +198,9 @@ def _get_tool_input_schema(tool_name: str) -> BaseModel:
         period: str = Field(default="1y", description="Time period (1d, 5d, 1mo, 3mo, 6mo, 1y, 2y, 5y, 10y, ytd, max)")
         interval: str = Field(default="1d", description="Data interval (1m, 2m, 5m, 15m, 30m, 60m, 90m, 1h, 1d, 5d, 1wk, 1mo, 3mo)")
     
+    class IndicatorInput(SymbolWithPeriodInput):
+        limit: Optional[int] = Field(default=None, description="Return only the latest N data points; omit for the full series")
+    
     class ForexInput(BaseInput):
         from_symbol: str = Field(description="From currency symbol (e.g., USD)")
         to_symbol: str = Field(description="To currency symbol (e.g., EUR)")
@@ -229,8 +233,10 @@ def _get_tool_input_schema(tool_name: str) -> BaseModel:
                      "CASH_FLOW", "EARNINGS", "NEWS_SENTIMENT", "INSIDER_TRANSACTIONS", 
                      "ANALYTICS_FIXED_WINDOW", "ANALYTICS_SLIDING_WINDOW"]:
         return SymbolInput
-    elif tool_name.startswith("TIME_SERIES_") or tool_name in ["SMA", "EMA", "RSI", "MACD", "BBANDS", "STOCH", "STOCHF", "STOCHRSI", "WILLR", "ADX", "ADXR", "APO", "PPO", "MOM", "BOP", "CCI", "CMO", "ROC", "ROCR", "AROON", "AROONOSC", "MFI", "TRIX", "ULTOSC", "DX", "MINUS_DI", "PLUS_DI", "MINUS_DM", "PLUS_DM", "MIDPOINT", "MIDPRICE", "SAR", "TRANGE", "ATR", "NATR", "AD", "ADOSC", "OBV", "WMA", "DEMA", "TEMA", "TRIMA", "KAMA", "MAMA", "VWAP", "T3", "MACDEXT"] or tool_name.startswith("HT_"):
+    elif tool_name.startswith("TIME_SERIES_"):
         return SymbolWithPeriodInput
+    elif tool_name in ["SMA", "EMA", "RSI", "MACD", "BBANDS", "STOCH", "STOCHF", "STOCHRSI", "WILLR", "ADX", "ADXR", "APO", "PPO", "MOM", "BOP", "CCI", "CMO", "ROC", "ROCR", "AROON", "AROONOSC", "MFI", "TRIX", "ULTOSC", "DX", "MINUS_DI", "PLUS_DI", "MINUS_DM", "PLUS_DM", "MIDPOINT", "MIDPRICE", "SAR", "TRANGE", "ATR", "NATR", "AD", "ADOSC", "OBV", "WMA", "DEMA", "TEMA", "TRIMA", "KAMA", "MAMA", "VWAP", "T3", "MACDEXT"] or tool_name.startswith("HT_"):
+        return IndicatorInput
     elif tool_name.startswith("FX_"):
         return ForexInput
     elif tool_name.startswith("DIGITAL_CURRENCY_") or tool_name == "CURRENCY_EXCHANGE_RATE":
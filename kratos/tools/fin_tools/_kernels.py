@@ -0,0 +1,198 @@
+"""
+Numerical kernels shared by the fin_tools handlers.
+
+When numba is installed each kernel is compiled at import time against pinned
+signatures and cached on disk, so the first tool call in a process pays no JIT
+warm-up. Without numba the vectorised numpy equivalents are used instead, and
+the moving-average/RSI/MACD kernels are ``None`` so callers keep using pandas-ta.
+"""
+
+from __future__ import annotations
+
+import math
+from typing import Tuple
+
+import numpy as np
+import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
+
+try:  # pragma: no cover - optional dependency
+    from numba import njit, types  # type: ignore
+except ModuleNotFoundError:  # pragma: no cover - optional dependency
+    njit = None  # type: ignore[assignment]
+    types = None  # type: ignore[assignment]
+
+
+def _sliding_stats_loop(prices: np.ndarray, window: int, step: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Per-slice return and scaled volatility using a one-pass Welford update."""
+    count = (prices.shape[0] - window) // step + 1 if prices.shape[0] >= window else 0
+    returns = np.empty(count)
+    vols = np.empty(count)
+    scale = math.sqrt(window)
+    for k in range(count):
+        start = k * step
+        returns[k] = prices[start + window - 1] / prices[start] - 1.0
+        mean = 0.0
+        m2 = 0.0
+        seen = 0
+        for i in range(start + 1, start + window):
+            change = prices[i] / prices[i - 1] - 1.0
+            seen += 1
+            delta = change - mean
+            mean += delta / seen
+            m2 += delta * (change - mean)
+        vols[k] = math.sqrt(m2 / (seen - 1)) * scale if seen > 1 else np.nan
+    return returns, vols
+
+
+def _sliding_stats_numpy(prices: np.ndarray, window: int, step: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Vectorised equivalent of ``_sliding_stats_loop`` for when numba is absent.
+
+    Volatility comes from one rolling std over all price changes, so each slice
+    is an index lookup rather than its own pct_change().std() pass.
+    """
+    if prices.shape[0] < window:
+        return np.empty(0), np.empty(0)
+    starts = np.arange(0, prices.shape[0] - window + 1, step)
+    returns = prices[starts + window - 1] / prices[starts] - 1.0
+    if window < 3:
+        return returns, np.full(starts.shape[0], np.nan)
+    # A slice of ``window`` prices holds ``window - 1`` changes, ending at start + window - 2.
+    changes = pd.Series(prices[1:] / prices[:-1] - 1.0)
+    rolling_std = changes.rolling(window - 1).std().to_numpy()
+    return returns, rolling_std[starts + window - 2] * math.sqrt(window)
+
+
+def weighted_moving_average(values: np.ndarray, weights: np.ndarray) -> np.ndarray:
+    """Moving average applying ``weights`` (oldest first) to every trailing window.
+
+    All windows are weighted in one matrix-vector product over strided views.
+    """
+    length = weights.shape[0]
+    out = np.full(values.shape[0], np.nan)
+    if values.shape[0] >= length:
+        out[length - 1:] = sliding_window_view(values, length) @ (weights / weights.sum())
+    return out
+
+
+def _sma_loop(values: np.ndarray, length: int) -> np.ndarray:
+    """Simple moving average from a running window sum."""
+    out = np.full(values.shape[0], np.nan)
+    total = 0.0
+    for i in range(values.shape[0]):
+        total += values[i]
+        if i >= length:
+            total -= values[i - length]
+        if i >= length - 1:
+            out[i] = total / length
+    return out
+
+
+def _ema_loop(values: np.ndarray, length: int) -> np.ndarray:
+    """Exponential moving average seeded with the SMA of the first ``length`` values."""
+    n = values.shape[0]
+    out = np.full(n, np.nan)
+    if n < length:
+        return out
+    level = 0.0
+    for i in range(length):
+        level += values[i]
+    level /= length
+    out[length - 1] = level
+    alpha = 2.0 / (length + 1.0)
+    for i in range(length, n):
+        level = alpha * values[i] + (1.0 - alpha) * level
+        out[i] = level
+    return out
+
+
+def _rsi_loop(values: np.ndarray, length: int) -> np.ndarray:
+    """Relative strength index over pandas-ta's ``rma``: an adjusted EWM with alpha = 1 / length.
+
+    The adjusted mean's normalising weight is shared by the average gain and
+    loss, so it cancels in the ratio and only the weighted sums are tracked.
+    """
+    n = values.shape[0]
+    out = np.full(n, np.nan)
+    decay = 1.0 - 1.0 / length
+    gain = 0.0
+    loss = 0.0
+    for i in range(1, n):
+        change = values[i] - values[i - 1]
+        gain = decay * gain + (change if change > 0 else 0.0)
+        loss = decay * loss + (-change if change < 0 else 0.0)
+        if i >= length:
+            total = gain + loss
+            out[i] = 100.0 * gain / total if total > 0 else np.nan
+    return out
+
+
+def _macd_loop(values: np.ndarray, fast: int, slow: int, signal: int) -> Tuple[np.ndarray, np.ndarray]:
+    """MACD line and signal from one pass, advancing the fast, slow and signal EMAs together.
+
+    Each EMA is seeded with the SMA of its first ``length`` inputs, and the
+    signal starts at the first defined MACD value, matching pandas-ta.
+    """
+    n = values.shape[0]
+    line = np.full(n, np.nan)
+    smoothed = np.full(n, np.nan)
+    alpha_fast = 2.0 / (fast + 1.0)
+    alpha_slow = 2.0 / (slow + 1.0)
+    alpha_signal = 2.0 / (signal + 1.0)
+    level_fast = 0.0
+    level_slow = 0.0
+    level_signal = 0.0
+    for i in range(n):
+        x = values[i]
+        if i < fast:
+            level_fast += x
+            if i == fast - 1:
+                level_fast /= fast
+        else:
+            level_fast = alpha_fast * x + (1.0 - alpha_fast) * level_fast
+        if i < slow:
+            level_slow += x
+            if i == slow - 1:
+                level_slow /= slow
+        else:
+            level_slow = alpha_slow * x + (1.0 - alpha_slow) * level_slow
+        k = i - (slow - 1)
+        if k < 0:
+            continue
+        diff = level_fast - level_slow
+        line[i] = diff
+        if k < signal:
+            level_signal += diff
+            if k == signal - 1:
+                level_signal /= signal
+                smoothed[i] = level_signal
+        else:
+            level_signal = alpha_signal * diff + (1.0 - alpha_signal) * level_signal
+            smoothed[i] = level_signal
+    return line, smoothed
+
+
+if njit is not None:
+    # One read-only, any-layout array type covers writable, read-only and strided
+    # inputs alike; listing a writable signature too makes C arrays ambiguous. The
+    # kernels release the GIL so concurrent tool calls on worker threads run in parallel.
+    _F64_ARRAY = types.Array(types.float64, 1, "A", readonly=True)
+    sliding_stats = njit(
+        types.UniTuple(types.float64[:], 2)(_F64_ARRAY, types.int64, types.int64), cache=True, nogil=True
+    )(_sliding_stats_loop)
+    _series_signature = types.float64[:](_F64_ARRAY, types.int64)
+    sma = njit(_series_signature, cache=True, nogil=True)(_sma_loop)
+    ema = njit(_series_signature, cache=True, nogil=True)(_ema_loop)
+    rsi = njit(_series_signature, cache=True, nogil=True)(_rsi_loop)
+    macd = njit(
+        types.UniTuple(types.float64[:], 2)(_F64_ARRAY, types.int64, types.int64, types.int64),
+        cache=True,
+        nogil=True,
+    )(_macd_loop)
+else:
+    sliding_stats = _sliding_stats_numpy
+    # Plain Python loops would be slower than pandas-ta; callers keep using it instead.
+    sma = ema = rsi = macd = None
+
+
+__all__ = ["ema", "macd", "rsi", "sliding_stats", "sma", "weighted_moving_average"]
@@ -4,9 +4,11 @@ Handlers for alpha intelligence focused tools such as news, movers, and analytic
 
 from __future__ import annotations
 
-import math
 from typing import Any, Callable, Dict, List, Optional
 
+import numpy as np
+import pandas as pd
+
 from .base import (
     ToolExecutionError,
     ensure_symbol,
@@ -16,15 +18,17 @@ from .base import (
     history,
     ttl_cache,
 )
+from ._kernels import sliding_stats
 
-_POSITIVE_WORDS = {"beat", "strong", "surge", "growth", "record", "outperform", "upgrade", "bullish"}
-_NEGATIVE_WORDS = {"miss", "weak", "drop", "decline", "downgrade", "bearish", "lawsuit", "loss"}
+_POSITIVE_WORDS = frozenset({"beat", "strong", "surge", "growth", "record", "outperform", "upgrade", "bullish"})
+_NEGATIVE_WORDS = frozenset({"miss", "weak", "drop", "decline", "downgrade", "bearish", "lawsuit", "loss"})
+_PUNCT_TABLE = str.maketrans("", "", ".,!?;:\"'()[]")
 
 
 def _compute_sentiment(text: str) -> float:
     if not text:
         return 0.0
-    words = {word.strip(".,!?").lower() for word in text.split()}
+    words = set(text.lower().translate(_PUNCT_TABLE).split())
     pos_hits = len(words & _POSITIVE_WORDS)
     neg_hits = len(words & _NEGATIVE_WORDS)
     total = pos_hits + neg_hits
@@ -54,21 +58,30 @@ def news_sentiment(symbol: str, *, limit: int = 10) -> Dict[str, Any]:
 
 
 
-@ttl_cache(ttl=120, maxsize=32)
-def _cached_top_movers(scr_id: str) -> List[Dict[str, Any]]:
-    url = f"https://query1.finance.yahoo.com/v1/finance/screener/predefined/saved?scrIds={scr_id}&count=25"
-    data = get_json(url)
-    results = data.get("finance", {}).get("result", [])
-    if not results:
-        return []
-    return results[0].get("quotes", [])
+_MOVER_SCREENS = ("day_gainers", "day_losers", "most_actives")
+_SCREENER_URL = "https://query1.finance.yahoo.com/v1/finance/screener/predefined/saved?scrIds={}&count=25"
+
+
+@ttl_cache(ttl=120, maxsize=1)
+def _cached_all_movers() -> List[Any]:
+    """Fetch every mover screen with one combined ``scrIds`` request."""
+    data = get_json(_SCREENER_URL.format(",".join(_MOVER_SCREENS)))
+    if data.get("error"):
+        return [data] * len(_MOVER_SCREENS)
+    results = data.get("finance", {}).get("result") or []
+    by_id = {result.get("id"): result for result in results}
+    screens = []
+    for position, scr_id in enumerate(_MOVER_SCREENS):
+        result = by_id.get(scr_id)
+        if result is None and position < len(results):
+            result = results[position]
+        screens.append((result or {}).get("quotes", []))
+    return screens
 
 
 def top_gainers_losers() -> Dict[str, Any]:
     try:
-        gainers = _cached_top_movers("day_gainers")
-        losers = _cached_top_movers("day_losers")
-        actives = _cached_top_movers("most_actives")
+        gainers, losers, actives = _cached_all_movers()
         
         # Check if any of the responses contain errors
         error_responses = []
@@ -97,12 +110,16 @@ def top_gainers_losers() -> Dict[str, Any]:
     return format_response("TOP_GAINERS_LOSERS", gainers=gainers, losers=losers, most_active=actives)
 
 
+# Cached in place of an empty result so tickers without data are not refetched.
+_NO_DATA = object()
+
+
 @ttl_cache(ttl=600, maxsize=128)
 def _cached_insider_transactions(symbol: str) -> Any:
     ticker = get_ticker(symbol)
     data = ticker.get_insider_transactions()
     if data is None or data.empty:
-        raise ToolExecutionError(f"No insider transactions available for {symbol}.")
+        return _NO_DATA
     return data
 
 
@@ -110,47 +127,66 @@ def insider_transactions(symbol: str) -> Dict[str, Any]:
     symbol = ensure_symbol(symbol)
     try:
         data = _cached_insider_transactions(symbol)
-    except ToolExecutionError as exc:
-        raise exc
+    except ToolExecutionError:
+        raise
     except Exception as exc:
         raise ToolExecutionError(f"Failed to fetch insider transactions for {symbol}: {exc}") from exc
+    if data is _NO_DATA:
+        raise ToolExecutionError(f"No insider transactions available for {symbol}.")
     return format_response("INSIDER_TRANSACTIONS", symbol=symbol, data=data)
 
 
 def analytics_fixed_window(symbol: str, *, window: int = 30) -> Dict[str, Any]:
-    data = history(symbol, interval="1d", period=f"{max(window * 2, 60)}d")
-    closing = data["Close"]
+    symbol = ensure_symbol(symbol)
     window = int(window)
-    rolling = closing.rolling(window=window)
+    # Calendar days covering window + 1 trading bars, with slack for weekends and holidays.
+    data = history(symbol, interval="1d", period=f"{int(window * 1.6) + 5}d")
+    prices = data["Close"].to_numpy(dtype=np.float64)
+    # Only the latest window is reported, so skip building a full rolling series.
+    if prices.shape[0] >= window:
+        tail = prices[-window:]
+        stats = (tail.mean(), tail.std(ddof=1), tail.min(), tail.max())
+    else:
+        stats = (np.nan,) * 4
     metrics = {
-        "mean": float(rolling.mean().iloc[-1]),
-        "std": float(rolling.std().iloc[-1]),
-        "min": float(rolling.min().iloc[-1]),
-        "max": float(rolling.max().iloc[-1]),
-        "return_pct": float(((closing.iloc[-1] / closing.iloc[-window]) - 1) * 100) if len(closing) > window else None,
+        "mean": float(stats[0]),
+        "std": float(stats[1]),
+        "min": float(stats[2]),
+        "max": float(stats[3]),
+        "return_pct": float((prices[-1] / prices[-window] - 1) * 100) if prices.shape[0] > window else None,
     }
-    return format_response("ANALYTICS_FIXED_WINDOW", symbol=ensure_symbol(symbol), window=window, metrics=metrics)
+    return format_response("ANALYTICS_FIXED_WINDOW", symbol=symbol, window=window, metrics=metrics)
+
+
+def _isoformat_index(index: pd.DatetimeIndex) -> np.ndarray:
+    """Vectorised ``Timestamp.isoformat()`` for second-resolution daily bars."""
+    if index.tz is None:
+        return index.strftime("%Y-%m-%dT%H:%M:%S").to_numpy()
+    # strftime renders offsets as +HHMM; isoformat uses +HH:MM.
+    stamps = index.strftime("%Y-%m-%dT%H:%M:%S%z")
+    return (stamps.str[:-2] + ":" + stamps.str[-2:]).to_numpy()
 
 
 def analytics_sliding_window(symbol: str, *, window: int = 30, step: int = 5) -> Dict[str, Any]:
+    symbol = ensure_symbol(symbol)
     data = history(symbol, interval="1d", period=f"{max(window * 3, 120)}d")
     closing = data["Close"]
     window = int(window)
     step = max(1, int(step))
-    slices = []
-    for start_idx in range(0, len(closing) - window + 1, step):
-        slice_close = closing.iloc[start_idx : start_idx + window]
-        slices.append(
-            {
-                "start": slice_close.index[0].isoformat(),
-                "end": slice_close.index[-1].isoformat(),
-                "return_pct": float(((slice_close.iloc[-1] / slice_close.iloc[0]) - 1) * 100),
-                "volatility": float(slice_close.pct_change().std() * math.sqrt(window)),
-            }
-        )
+    returns, vols = sliding_stats(closing.to_numpy(dtype=np.float64), window, step)
+    stamps = _isoformat_index(closing.index)
+    slices = [
+        {
+            "start": stamps[start],
+            "end": stamps[start + window - 1],
+            "return_pct": float(ret * 100),
+            "volatility": float(vol),
+        }
+        for start, ret, vol in zip(range(0, len(returns) * step, step), returns, vols)
+    ]
     return format_response(
         "ANALYTICS_SLIDING_WINDOW",
-        symbol=ensure_symbol(symbol),
+        symbol=symbol,
         window=window,
         step=step,
         slices=slices,
@@ -8,15 +8,30 @@ focused on domain specific logic.
 
 from __future__ import annotations
 
+import atexit
 import datetime as _dt
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import threading
 import time
 from collections import OrderedDict
-from functools import lru_cache, wraps
-from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
+from concurrent.futures import Future
+from functools import lru_cache, partial, wraps
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple, Union
 
+import numpy as np
 import pandas as pd
 import yfinance as yf
 
+try:  # pragma: no cover - optional dependency
+    import orjson  # type: ignore
+except ModuleNotFoundError:  # pragma: no cover - optional dependency
+    orjson = None  # type: ignore[assignment]
+
 DataFrameLike = Union[pd.DataFrame, pd.Series]
 
 
@@ -34,38 +49,48 @@ def _clone(value: Any) -> Any:
     return value
 
 
-def ttl_cache(ttl: int = 300, maxsize: int = 128) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+def ttl_cache(
+    ttl: int = 300, maxsize: int = 128, copy: bool = True
+) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
     """
     Lightweight TTL cache that stores the most recent results.
 
     Args:
         ttl: seconds before a cached item expires.
         maxsize: maximum number of cached entries.
+        copy: hand out deep copies; disable only for values callers never mutate.
     """
+    clone = _clone if copy else (lambda value: value)
 
     def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
         cache: "OrderedDict[Tuple[Any, ...], Tuple[Any, float]]" = OrderedDict()
+        # Guards the bookkeeping only; ``func`` itself runs outside the lock.
+        lock = threading.Lock()
 
         @wraps(func)
         def wrapper(*args: Any, **kwargs: Any) -> Any:
             key = (args, tuple(sorted(kwargs.items())))
             now = time.time()
-            if key in cache:
-                value, timestamp = cache[key]
-                if now - timestamp < ttl:
-                    cache.move_to_end(key)
-                    return _clone(value)
-                del cache[key]
+            with lock:
+                entry = cache.get(key)
+                if entry is not None:
+                    value, timestamp = entry
+                    if now - timestamp < ttl:
+                        cache.move_to_end(key)
+                        return clone(value)
+                    del cache[key]
             result = func(*args, **kwargs)
-            cached_value = _clone(result)
-            cache[key] = (cached_value, now)
-            cache.move_to_end(key)
-            while len(cache) > maxsize:
-                cache.popitem(last=False)
-            return _clone(cached_value)
+            cached_value = clone(result)
+            with lock:
+                cache[key] = (cached_value, now)
+                cache.move_to_end(key)
+                while len(cache) > maxsize:
+                    cache.popitem(last=False)
+            return clone(cached_value)
 
         def cache_clear() -> None:
-            cache.clear()
+            with lock:
+                cache.clear()
 
         wrapper.cache_clear = cache_clear  # type: ignore[attr-defined]
         return wrapper
@@ -73,6 +98,136 @@ def ttl_cache(ttl: int = 300, maxsize: int = 128) -> Callable[[Callable[..., Any
     return decorator
 
 
+class SingleFlight:
+    """Run at most one call per key at a time; concurrent callers share its outcome."""
+
+    def __init__(self) -> None:
+        self._calls: Dict[Any, Future] = {}
+        self._lock = threading.Lock()
+
+    def do(self, key: Any, fn: Callable[[], Any]) -> Any:
+        with self._lock:
+            future = self._calls.get(key)
+            leader = future is None
+            if leader:
+                future = self._calls[key] = Future()
+        if not leader:
+            return future.result()
+        try:
+            future.set_result(fn())
+        except BaseException as exc:
+            future.set_exception(exc)
+        finally:
+            with self._lock:
+                del self._calls[key]
+        return future.result()
+
+
+def single_flight(func: Callable[..., Any]) -> Callable[..., Any]:
+    """
+    Coalesce concurrent calls with identical arguments into one execution.
+
+    Place it beneath ``ttl_cache`` so that callers missing the cache together
+    wait on a single upstream fetch instead of each issuing their own.
+    """
+
+    flight = SingleFlight()
+
+    @wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        key = (args, tuple(sorted(kwargs.items())))
+        return flight.do(key, partial(func, *args, **kwargs))
+
+    return wrapper
+
+
+@lru_cache(maxsize=1)
+def _cache_root() -> Path:
+    """Directory for on-disk caches; ``KRATOS_CACHE_DIR`` overrides the default."""
+    root = os.environ.get("KRATOS_CACHE_DIR")
+    return Path(root).expanduser() if root else Path.home() / ".kratos" / "cache"
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=path.name, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as handle:
+            handle.write(data)
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+_PERSISTENT_SUBDIRS: Set[str] = set()
+
+
+def _prune_cache_dir(directory: Path, maxsize: int) -> None:
+    """Drop the oldest cache files once ``directory`` holds more than ``maxsize``."""
+    entries = []
+    for path in directory.glob("*.json"):
+        try:
+            entries.append((path.stat().st_mtime, path))
+        except OSError:
+            continue
+    if len(entries) <= maxsize:
+        return
+    entries.sort()
+    for _, path in entries[: len(entries) - maxsize]:
+        path.unlink(missing_ok=True)
+
+
+def persistent_ttl_cache(
+    ttl: int, subdir: str, maxsize: int = 512
+) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """
+    File-backed TTL cache shared across processes and restarts.
+
+    Each call is stored as one JSON file under ``<cache root>/<subdir>/`` named
+    by a hash of the function name and arguments; the file mtime decides expiry.
+    Results must be JSON-serialisable, so convert frames to records first.
+    Misses return the stored JSON decoded again, so they match later hits.
+    Payloads flagged as errors by ``get_json`` are returned but never stored,
+    and unreadable or unwritable cache files fall back to calling ``func``.
+
+    Args:
+        ttl: seconds before a cached file expires; expired files are removed on read.
+        subdir: cache subdirectory for this function.
+        maxsize: files kept in ``subdir``; the oldest are removed beyond it.
+    """
+    _PERSISTENT_SUBDIRS.add(subdir)
+
+    def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+        @wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            key = repr((func.__qualname__, args, tuple(sorted(kwargs.items()))))
+            path = _cache_root() / subdir / (hashlib.sha1(key.encode()).hexdigest() + ".json")
+            try:
+                if time.time() - path.stat().st_mtime < ttl:
+                    return json.loads(path.read_bytes())
+                path.unlink(missing_ok=True)
+            except (OSError, ValueError):
+                pass
+            result = func(*args, **kwargs)
+            if isinstance(result, dict) and result.get("error"):
+                return result
+            try:
+                data = json.dumps(result, default=str).encode()
+            except (TypeError, ValueError):
+                return result
+            try:
+                _write_atomic(path, data)
+                _prune_cache_dir(path.parent, maxsize)
+            except OSError:
+                pass
+            return json.loads(data)
+
+        return wrapper
+
+    return decorator
+
+
 def _isoformat(value: Union[_dt.datetime, _dt.date, pd.Timestamp]) -> str:
     if isinstance(value, pd.Timestamp):
         if value.tzinfo is not None:
@@ -87,28 +242,53 @@ def _isoformat(value: Union[_dt.datetime, _dt.date, pd.Timestamp]) -> str:
     raise TypeError(f"Unsupported temporal type: {type(value)!r}")
 
 
+def _isoformat_column(series: pd.Series) -> List[str]:
+    """Vectorised ``_isoformat`` for a datetime64 column."""
+    if series.dt.tz is not None:
+        series = series.dt.tz_convert(None)
+    values = series.to_numpy(dtype="datetime64[us]")
+    stamps = np.datetime_as_string(values, unit="us")
+    # isoformat() omits the fractional part when it is zero; NaT never matches.
+    whole = values.view("int64") % 1_000_000 == 0
+    return np.where(whole, stamps.astype("<U19"), stamps).tolist()
+
+
 def to_serialisable_records(data: DataFrameLike) -> List[Dict[str, Any]]:
     """Convert a pandas DataFrame/Series to JSON-friendly dict records."""
     if isinstance(data, pd.Series):
         frame = data.to_frame(name=data.name or "value")
     else:
-        frame = data.copy()
+        frame = data
     frame = frame.reset_index(drop=False)
-    for column in frame.columns:
-        if pd.api.types.is_datetime64_any_dtype(frame[column]):
-            frame[column] = frame[column].apply(_isoformat)
-        elif pd.api.types.is_object_dtype(frame[column]):
-            frame[column] = frame[column].apply(
+    # Convert column by column: ``tolist()`` yields native scalars in C, and only
+    # columns that actually hold nulls pay for the None substitution.
+    names = list(frame.columns)
+    columns = []
+    for position in range(len(names)):
+        series = frame.iloc[:, position]
+        if pd.api.types.is_datetime64_any_dtype(series):
+            columns.append(_isoformat_column(series))
+            continue
+        if pd.api.types.is_object_dtype(series):
+            series = series.apply(
                 lambda v: _isoformat(v) if isinstance(v, (pd.Timestamp, _dt.datetime, _dt.date)) else v
             )
-    frame = frame.where(pd.notnull(frame), None)
-    return frame.to_dict(orient="records")
+        values = series.tolist()
+        if series.hasnans:
+            values = [None if missing else value for value, missing in zip(values, series.isna().tolist())]
+        columns.append(values)
+    return [dict(zip(names, row)) for row in zip(*columns)]
+
+
+@lru_cache(maxsize=4096)
+def _normalise_symbol(symbol: str) -> str:
+    return symbol.upper().strip()
 
 
 def ensure_symbol(symbol: str) -> str:
     if not symbol or not isinstance(symbol, str):
         raise ToolExecutionError("A valid ticker symbol must be provided.")
-    return symbol.upper().strip()
+    return _normalise_symbol(symbol)
 
 
 def validate_period_inputs(
@@ -119,7 +299,7 @@ def validate_period_inputs(
     return start, end, period
 
 
-@lru_cache(maxsize=512)
+@lru_cache(maxsize=1024)
 def get_ticker(symbol: str) -> yf.Ticker:
     try:
         return yf.Ticker(symbol)
@@ -161,10 +341,13 @@ def history(
     period: Optional[str] = None,
     include_actions: bool = True,
     auto_adjust: bool = True,
+    cached: bool = True,
 ) -> pd.DataFrame:
     symbol = ensure_symbol(symbol)
     start, end, period = validate_period_inputs(start, end, period)
-    return _cached_history(symbol, interval, start, end, period, include_actions, auto_adjust)
+    # Callers that cache derived results on their own lifetime skip the frame cache.
+    fetch = _cached_history if cached else _cached_history.__wrapped__
+    return fetch(symbol, interval, start, end, period, include_actions, auto_adjust)
 
 
 @ttl_cache(ttl=600, maxsize=256)
@@ -200,13 +383,27 @@ def download(
     return _cached_download(tickers, start, end, period, interval)
 
 
+@lru_cache(maxsize=1)
+def _http_session() -> "requests.Session":
+    """Shared keep-alive session so repeated Yahoo requests reuse connections."""
+    import requests
+    from requests.adapters import HTTPAdapter
+
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    atexit.register(session.close)
+    return session
+
+
 @ttl_cache(ttl=600, maxsize=128)
 def get_json(url: str) -> Dict[str, Any]:
     import requests
     try:
-        response = requests.get(url, timeout=10)
+        response = _http_session().get(url, timeout=10)
         response.raise_for_status()
-        data = response.json()
+        data = orjson.loads(response.content) if orjson is not None else response.json()
     except requests.exceptions.HTTPError as exc:
         if exc.response.status_code == 429:
             # Rate limit - return structured error that agent can handle
@@ -258,12 +455,28 @@ def format_response(tool_name: str, **payload: Any) -> Dict[str, Any]:
     return {"tool": tool_name, **serialised}
 
 
+def dump_json(payload: Any) -> str:
+    """Encode a tool payload as JSON, through orjson when it is installed.
+
+    Values JSON cannot represent natively, such as timestamps, fall back to ``str``.
+    """
+    if orjson is not None:
+        return orjson.dumps(
+            payload,
+            default=str,
+            option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS,
+        ).decode()
+    return json.dumps(payload, default=str)
+
+
 def clear_caches() -> None:
-    """Utility to clear all TTL/LRU caches (mainly for testing)."""
+    """Utility to clear all TTL/LRU and on-disk caches (mainly for testing)."""
     _cached_history.cache_clear()
     _cached_download.cache_clear()
     get_json.cache_clear()
     get_ticker.cache_clear()  # type: ignore[attr-defined]
+    for subdir in _PERSISTENT_SUBDIRS:
+        shutil.rmtree(_cache_root() / subdir, ignore_errors=True)
 
 
 __all__ = [
@@ -274,8 +487,12 @@ __all__ = [
     "download",
     "get_ticker",
     "format_response",
+    "dump_json",
     "to_serialisable_records",
     "ttl_cache",
+    "SingleFlight",
+    "single_flight",
+    "persistent_ttl_cache",
     "get_json",
     "clear_caches",
 ]
@@ -4,6 +4,7 @@ Handlers for commodity market tools.
 
 from __future__ import annotations
 
+from functools import partial
 from typing import Any, Callable, Dict
 
 from .base import format_response, history
@@ -35,9 +36,12 @@ def commodity(tool_name: str, *, period: str = "6mo", interval: str = "1d") -> D
     return format_response(tool_name, symbol=symbol, data=data)
 
 
+def _dispatch(tool_name: str, **kwargs: Any) -> Dict[str, Any]:
+    return commodity(tool_name, period=kwargs.get("period", "6mo"), interval=kwargs.get("interval", "1d"))
+
+
 HANDLERS: Dict[str, Callable[..., Dict[str, Any]]] = {
-    name: (lambda tool=name: (lambda **kwargs: commodity(tool, period=kwargs.get("period", "6mo"), interval=kwargs.get("interval", "1d"))))()
-    for name in _COMMODITY_SYMBOLS
+    name: partial(_dispatch, name) for name in _COMMODITY_SYMBOLS
 }
 
 
@@ -5,7 +5,16 @@ Handlers for core stock market data tools.
 from __future__ import annotations
 
 import datetime as _dt
-from typing import Any, Callable, Dict, Iterable, Optional
+import numbers
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+from zoneinfo import ZoneInfo
+
+import yfinance as yf
 
 from .base import (
     ToolExecutionError,
@@ -14,20 +23,26 @@ from .base import (
     get_json,
     get_ticker,
     history,
+    persistent_ttl_cache,
+    single_flight,
+    to_serialisable_records,
     ttl_cache,
 )
 
 
-def _time_series(
-    tool_name: str,
-    *,
+# Cache lifetime in seconds per bar interval; finer bars go stale sooner.
+_TIME_SERIES_TTL = {"1m": 30, "5m": 60, "1h": 300, "1d": 3600, "1wk": 7200, "1mo": 14400}
+_DEFAULT_TIME_SERIES_TTL = 60
+
+
+def _fetch_time_series(
     symbol: str,
     interval: str,
-    period: Optional[str] = None,
-    start: Optional[str] = None,
-    end: Optional[str] = None,
-    adjusted: bool = True,
-) -> Dict[str, Any]:
+    period: Optional[str],
+    start: Optional[str],
+    end: Optional[str],
+    adjusted: bool,
+) -> List[Dict[str, Any]]:
     data = history(
         symbol,
         interval=interval,
@@ -36,10 +51,36 @@ def _time_series(
         end=end,
         auto_adjust=adjusted,
         include_actions=True,
+        cached=False,
     )
+    return to_serialisable_records(data)
+
+
+# Serialised records are cached so repeat requests skip both the fetch and pandas.
+# The frame cache is bypassed, so these per-interval lifetimes decide freshness.
+_TIME_SERIES_CACHES = {
+    ttl: ttl_cache(ttl=ttl, maxsize=512)(_fetch_time_series)
+    for ttl in {*_TIME_SERIES_TTL.values(), _DEFAULT_TIME_SERIES_TTL}
+}
+
+
+def _time_series(
+    tool_name: str,
+    *,
+    symbol: str,
+    interval: str,
+    period: Optional[str] = None,
+    start: Optional[str] = None,
+    end: Optional[str] = None,
+    adjusted: bool = True,
+) -> Dict[str, Any]:
+    symbol = ensure_symbol(symbol)
+    interval = interval.lower()
+    fetch = _TIME_SERIES_CACHES[_TIME_SERIES_TTL.get(interval, _DEFAULT_TIME_SERIES_TTL)]
+    data = fetch(symbol, interval, period, start, end, adjusted)
     return format_response(
         tool_name,
-        symbol=ensure_symbol(symbol),
+        symbol=symbol,
         interval=interval,
         period=period,
         start=start,
@@ -50,6 +91,8 @@ def _time_series(
 
 
 @ttl_cache(ttl=60, maxsize=256)
+@single_flight
+@persistent_ttl_cache(ttl=60, subdir="quote")
 def _cached_quote(symbol: str) -> Dict[str, Any]:
     ticker = get_ticker(symbol)
     try:
@@ -66,7 +109,18 @@ def _cached_quote(symbol: str) -> Dict[str, Any]:
         "regular_market_change_percent": fast_info.get("regular_market_change_percent"),
         "regular_market_time": fast_info.get("regular_market_time"),
     }
-    return {"quote": quote, "latest": latest.tail(1)}
+    # Fill gaps from the bars already in hand. Price and previous close come from
+    # one source together so the derived change never mixes fast_info with bars.
+    price, previous = quote["price"], quote["previous_close"]
+    closes = latest["Close"].to_numpy(dtype=float)
+    if (price is None or previous is None) and closes.shape[0] >= 2:
+        previous, price = float(closes[-2]), float(closes[-1])
+        quote["price"], quote["previous_close"] = price, previous
+    if quote["regular_market_change"] is None and price is not None and previous is not None:
+        quote["regular_market_change"] = price - previous
+        quote["regular_market_change_percent"] = (price / previous - 1.0) * 100.0 if previous else None
+    # Cache the serialised row rather than a DataFrame so hits skip pandas entirely.
+    return {"quote": quote, "latest": to_serialisable_records(latest.tail(1))}
 
 
 def global_quote(symbol: str) -> Dict[str, Any]:
@@ -75,32 +129,109 @@ def global_quote(symbol: str) -> Dict[str, Any]:
     return format_response("GLOBAL_QUOTE", quote=payload["quote"], data=payload["latest"])
 
 
+# Per-ticker fallback for symbols the batched download misses; lookups are
+# network-bound, so a shared pool fetches them concurrently.
+_QUOTE_POOL = ThreadPoolExecutor(max_workers=32, thread_name_prefix="bulk-quotes")
+
+
+# A listing's currency does not change, so lookups are kept for a day. Failures
+# raise inside the cache and are not stored.
+@ttl_cache(ttl=86400, maxsize=1024)
+def _cached_currency(symbol: str) -> Optional[str]:
+    return get_ticker(symbol).fast_info["currency"]
+
+
+def _currency(symbol: str) -> Optional[str]:
+    try:
+        return _cached_currency(symbol)
+    except Exception:
+        return None
+
+
+def _market_time(value: Any) -> Optional[str]:
+    """ISO string for a quote time given as epoch seconds or a datetime."""
+    if value is None:
+        return None
+    if isinstance(value, numbers.Real):
+        value = _dt.datetime.fromtimestamp(value, _dt.timezone.utc)
+    return value.isoformat()
+
+
+def _bulk_quote(symbol: str) -> Dict[str, Any]:
+    ticker = get_ticker(symbol)
+    try:
+        fast_info = dict(ticker.fast_info)
+    except Exception:
+        fast_info = {}
+    return {
+        "symbol": symbol,
+        "price": fast_info.get("last_price"),
+        "currency": _currency(symbol),
+        "regular_market_change": fast_info.get("regular_market_change"),
+        "regular_market_change_percent": fast_info.get("regular_market_change_percent"),
+        "regular_market_time": _market_time(fast_info.get("regular_market_time")),
+    }
+
+
+@ttl_cache(ttl=60, maxsize=64)
+def _cached_batch_quotes(symbols: Tuple[str, ...]) -> Dict[str, Dict[str, Any]]:
+    """Quotes for a basket from one batched download, keyed by symbol.
+
+    Symbols missing from the response are left out so callers can fall back
+    to per-ticker lookups.
+    """
+    try:
+        frame = yf.download(
+            " ".join(symbols),
+            period="5d",
+            interval="1d",
+            group_by="ticker",
+            auto_adjust=False,
+            threads=True,
+            progress=False,
+        )
+    except Exception:
+        return {}
+    if frame is None or frame.empty:
+        return {}
+    multi = frame.columns.nlevels > 1
+    present = set(frame.columns.get_level_values(0)) if multi else set(symbols[:1])
+    # The download endpoint carries no currency; memoised lookups fill it in.
+    found = [symbol for symbol in symbols if symbol in present]
+    currencies = dict(zip(found, _QUOTE_POOL.map(_currency, found)))
+    quotes: Dict[str, Dict[str, Any]] = {}
+    for symbol in found:
+        closes = (frame[symbol]["Close"] if multi else frame["Close"]).dropna()
+        if closes.empty:
+            continue
+        price = float(closes.iloc[-1])
+        previous = float(closes.iloc[-2]) if len(closes) > 1 else None
+        change = price - previous if previous is not None else None
+        quotes[symbol] = {
+            "symbol": symbol,
+            "price": price,
+            "currency": currencies[symbol],
+            "regular_market_change": change,
+            "regular_market_change_percent": change / previous * 100 if previous else None,
+            "regular_market_time": _market_time(closes.index[-1]),
+        }
+    return quotes
+
+
 def realtime_bulk_quotes(symbols: Iterable[str]) -> Dict[str, Any]:
-    symbols = list(symbols)
+    symbols = [ensure_symbol(raw) for raw in symbols]
     if not symbols:
         raise ToolExecutionError("Provide at least one symbol for bulk quotes.")
-    results = []
-    for raw in symbols:
-        symbol = ensure_symbol(raw)
-        ticker = get_ticker(symbol)
-        try:
-            fast_info = dict(ticker.fast_info)
-        except Exception:
-            fast_info = {}
-        results.append(
-            {
-                "symbol": symbol,
-                "price": fast_info.get("last_price"),
-                "currency": fast_info.get("currency"),
-                "regular_market_change": fast_info.get("regular_market_change"),
-                "regular_market_change_percent": fast_info.get("regular_market_change_percent"),
-                "regular_market_time": fast_info.get("regular_market_time"),
-            }
-        )
+    batched = _cached_batch_quotes(tuple(dict.fromkeys(symbols)))
+    missing = [symbol for symbol in dict.fromkeys(symbols) if symbol not in batched]
+    batched.update(zip(missing, _QUOTE_POOL.map(_bulk_quote, missing)))
+    results = [batched[symbol] for symbol in symbols]
     return format_response("REALTIME_BULK_QUOTES", quotes=results)
 
 
 @ttl_cache(ttl=1800, maxsize=64)
+@single_flight
+@persistent_ttl_cache(ttl=1800, subdir="symbol_search")
 def _cached_symbol_search(keywords: str, region: str, quotes_count: int) -> Dict[str, Any]:
     url = (
         f"https://query2.finance.yahoo.com/v1/finance/search?"
@@ -130,96 +261,91 @@ def symbol_search(keywords: str, *, region: str = "US", quotes_count: int = 10)
     return format_response("SYMBOL_SEARCH", query=query, region=region.upper(), results=data.get("quotes", []))
 
 
-def market_status(region: str = "US") -> Dict[str, Any]:
-    region = region.upper()
-    now_utc = _dt.datetime.utcnow()
-    weekday = now_utc.weekday()
-    is_weekend = weekday >= 5
+def _prewarm_search(keywords: str) -> None:
+    try:
+        _cached_symbol_search(keywords, "US", 10)
+    except Exception:
+        pass
+
+
+def _prewarm(keywords: List[str]) -> None:
+    for _ in _QUOTE_POOL.map(_prewarm_search, keywords):
+        pass
+
+
+# Opt-in: comma separated queries whose symbol search is fetched in the background at import.
+_PREWARM_SYMBOLS = [
+    keywords.strip() for keywords in os.environ.get("KRATOS_PREWARM_SYMBOLS", "").split(",") if keywords.strip()
+]
+if _PREWARM_SYMBOLS:
+    threading.Thread(
+        target=_prewarm, args=(_PREWARM_SYMBOLS,), name="symbol-search-prewarm", daemon=True
+    ).start()
+
+
+_UTC = _dt.timezone.utc
+_NY = ZoneInfo("America/New_York")
+
+
+@lru_cache(maxsize=8)
+def _market_status(region: str, minute: int) -> Dict[str, Any]:
+    """Status for ``region`` during the epoch ``minute``; burst callers share one result."""
+    now_utc = _dt.datetime.now(_UTC)
     exchange_open = False
     if region == "US":
-        eastern = _dt.timezone(_dt.timedelta(hours=-5))
-        now_eastern = now_utc.astimezone(eastern)
+        now_eastern = now_utc.astimezone(_NY)
+        is_weekend = now_eastern.weekday() >= 5
         open_time = now_eastern.replace(hour=9, minute=30, second=0, microsecond=0)
         close_time = now_eastern.replace(hour=16, minute=0, second=0, microsecond=0)
         exchange_open = open_time <= now_eastern <= close_time and not is_weekend
         hours = {"open": "09:30", "close": "16:00", "timezone": "America/New_York"}
     else:
+        is_weekend = now_utc.weekday() >= 5
         hours = {"open": None, "close": None, "timezone": "UTC"}
-    status = {
+    return {
         "region": region,
-        "timestamp_utc": now_utc.isoformat(),
+        "timestamp_utc": now_utc.replace(tzinfo=None).isoformat(),
         "is_weekend": is_weekend,
         "is_open": exchange_open,
         "hours": hours,
         "note": "Status approximated using standard exchange hours; holidays not accounted for.",
     }
-    return format_response("MARKET_STATUS", status=status)
 
 
-HANDLERS: Dict[str, Callable[..., Dict[str, Any]]] = {
-    "TIME_SERIES_INTRADAY": lambda **kwargs: _time_series(
-        "TIME_SERIES_INTRADAY",
-        interval=kwargs.get("interval", "1h"),
-        symbol=kwargs["symbol"],
-        period=kwargs.get("period", "7d"),
-        start=kwargs.get("start"),
-        end=kwargs.get("end"),
-        adjusted=kwargs.get("adjusted", True),
-    ),
-    "TIME_SERIES_DAILY": lambda **kwargs: _time_series(
-        "TIME_SERIES_DAILY",
-        interval="1d",
-        symbol=kwargs["symbol"],
-        period=kwargs.get("period", "1y"),
-        start=kwargs.get("start"),
-        end=kwargs.get("end"),
-        adjusted=kwargs.get("adjusted", True),
-    ),
-    "TIME_SERIES_DAILY_ADJUSTED": lambda **kwargs: _time_series(
-        "TIME_SERIES_DAILY_ADJUSTED",
-        interval="1d",
-        symbol=kwargs["symbol"],
-        period=kwargs.get("period", "1y"),
-        start=kwargs.get("start"),
-        end=kwargs.get("end"),
-        adjusted=True,
-    ),
-    "TIME_SERIES_WEEKLY": lambda **kwargs: _time_series(
-        "TIME_SERIES_WEEKLY",
-        interval="1wk",
-        symbol=kwargs["symbol"],
-        period=kwargs.get("period", "5y"),
-        start=kwargs.get("start"),
-        end=kwargs.get("end"),
-        adjusted=kwargs.get("adjusted", True),
-    ),
-    "TIME_SERIES_WEEKLY_ADJUSTED": lambda **kwargs: _time_series(
-        "TIME_SERIES_WEEKLY_ADJUSTED",
-        interval="1wk",
-        symbol=kwargs["symbol"],
-        period=kwargs.get("period", "5y"),
-        start=kwargs.get("start"),
-        end=kwargs.get("end"),
-        adjusted=True,
-    ),
-    "TIME_SERIES_MONTHLY": lambda **kwargs: _time_series(
-        "TIME_SERIES_MONTHLY",
-        interval="1mo",
-        symbol=kwargs["symbol"],
-        period=kwargs.get("period", "10y"),
-        start=kwargs.get("start"),
-        end=kwargs.get("end"),
-        adjusted=kwargs.get("adjusted", True),
-    ),
-    "TIME_SERIES_MONTHLY_ADJUSTED": lambda **kwargs: _time_series(
-        "TIME_SERIES_MONTHLY_ADJUSTED",
-        interval="1mo",
+def market_status(region: str = "US") -> Dict[str, Any]:
+    status = _market_status(region.upper(), int(time.time() // 60))
+    return format_response("MARKET_STATUS", status={**status, "hours": dict(status["hours"])})
+
+
+# tool name -> (interval, default period, adjusted prices only)
+_TIME_SERIES_DEFAULTS: Dict[str, Tuple[str, str, bool]] = {
+    "TIME_SERIES_INTRADAY": ("1h", "7d", False),
+    "TIME_SERIES_DAILY": ("1d", "1y", False),
+    "TIME_SERIES_DAILY_ADJUSTED": ("1d", "1y", True),
+    "TIME_SERIES_WEEKLY": ("1wk", "5y", False),
+    "TIME_SERIES_WEEKLY_ADJUSTED": ("1wk", "5y", True),
+    "TIME_SERIES_MONTHLY": ("1mo", "10y", False),
+    "TIME_SERIES_MONTHLY_ADJUSTED": ("1mo", "10y", True),
+}
+
+
+def _time_series_dispatch(tool_name: str, **kwargs: Any) -> Dict[str, Any]:
+    interval, period, adjusted_only = _TIME_SERIES_DEFAULTS[tool_name]
+    if tool_name == "TIME_SERIES_INTRADAY":
+        interval = kwargs.get("interval", interval)
+    return _time_series(
+        tool_name,
+        interval=interval,
         symbol=kwargs["symbol"],
-        period=kwargs.get("period", "10y"),
+        period=kwargs.get("period", period),
         start=kwargs.get("start"),
         end=kwargs.get("end"),
-        adjusted=True,
-    ),
+        adjusted=True if adjusted_only else kwargs.get("adjusted", True),
+    )
+
+
+HANDLERS: Dict[str, Callable[..., Dict[str, Any]]] = {
+    **{name: partial(_time_series_dispatch, name) for name in _TIME_SERIES_DEFAULTS},
     "GLOBAL_QUOTE": lambda **kwargs: global_quote(kwargs["symbol"]),
     "REALTIME_BULK_QUOTES": lambda **kwargs: realtime_bulk_quotes(kwargs.get("symbols", [])),
     "SYMBOL_SEARCH": lambda **kwargs: symbol_search(
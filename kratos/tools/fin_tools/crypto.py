@@ -23,6 +23,8 @@ def digital_currency_history(
     start: Optional[str] = None,
     end: Optional[str] = None,
 ) -> Dict[str, Any]:
+    symbol = ensure_symbol(symbol)
+    market = ensure_symbol(market)
     pair = _crypto_pair(symbol, market)
     data = history(
         pair,
@@ -35,8 +37,8 @@ def digital_currency_history(
     )
     return format_response(
         tool_name,
-        symbol=ensure_symbol(symbol),
-        market=ensure_symbol(market),
+        symbol=symbol,
+        market=market,
         data=data,
     )
 
@@ -4,9 +4,10 @@ Handlers for economic indicator tools backed by FRED series on Yahoo Finance.
 
 from __future__ import annotations
 
-from typing import Any, Callable, Dict
+from functools import partial
+from typing import Any, Callable, Dict, List
 
-from .base import format_response, history
+from .base import format_response, history, to_serialisable_records, ttl_cache
 
 _ECONOMIC_TICKERS = {
     "REAL_GDP": "GDPC1",
@@ -22,8 +23,9 @@ _ECONOMIC_TICKERS = {
 }
 
 
-def economic_indicator(tool_name: str, *, period: str = "10y", interval: str = "1mo") -> Dict[str, Any]:
-    symbol = _ECONOMIC_TICKERS[tool_name]
+# Indicator series update monthly at most, so an hour-old copy is as good as a fresh one.
+@ttl_cache(ttl=3600, maxsize=128)
+def _cached_indicator(symbol: str, period: str, interval: str) -> List[Dict[str, Any]]:
     data = history(
         symbol,
         interval=interval,
@@ -31,12 +33,20 @@ def economic_indicator(tool_name: str, *, period: str = "10y", interval: str = "
         auto_adjust=False,
         include_actions=False,
     )
-    return format_response(tool_name, symbol=symbol, data=data)
+    return to_serialisable_records(data)
+
+
+def economic_indicator(tool_name: str, *, period: str = "10y", interval: str = "1mo") -> Dict[str, Any]:
+    symbol = _ECONOMIC_TICKERS[tool_name]
+    return format_response(tool_name, symbol=symbol, data=_cached_indicator(symbol, period, interval))
+
+
+def _dispatch(tool_name: str, **kwargs: Any) -> Dict[str, Any]:
+    return economic_indicator(tool_name, period=kwargs.get("period", "10y"), interval=kwargs.get("interval", "1mo"))
 
 
 HANDLERS: Dict[str, Callable[..., Dict[str, Any]]] = {
-    name: (lambda tool=name: (lambda **kwargs: economic_indicator(tool, period=kwargs.get("period", "10y"), interval=kwargs.get("interval", "1mo"))))()
-    for name in _ECONOMIC_TICKERS
+    name: partial(_dispatch, name) for name in _ECONOMIC_TICKERS
 }
 
 
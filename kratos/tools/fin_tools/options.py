@@ -4,23 +4,38 @@ Handlers for options data tools.
 
 from __future__ import annotations
 
-from typing import Any, Callable, Dict, Optional
+from typing import Any, Callable, Dict, Optional, Tuple
 
-from .base import ToolExecutionError, ensure_symbol, format_response, get_ticker, download, ttl_cache
+from .base import (
+    ToolExecutionError,
+    download,
+    ensure_symbol,
+    format_response,
+    get_ticker,
+    persistent_ttl_cache,
+    single_flight,
+    to_serialisable_records,
+    ttl_cache,
+)
 
 
 @ttl_cache(ttl=300, maxsize=256)
+@single_flight
 def _cached_option_chain(symbol: str, expiration: str) -> Dict[str, Any]:
     ticker = get_ticker(symbol)
     chain = ticker.option_chain(expiration)
     return {"calls": chain.calls, "puts": chain.puts}
 
 
+@ttl_cache(ttl=300, maxsize=256)
+def _expirations(symbol: str) -> Tuple[str, ...]:
+    return tuple(get_ticker(symbol).options)
+
+
 def realtime_options(symbol: str, *, expiration: Optional[str] = None) -> Dict[str, Any]:
     symbol = ensure_symbol(symbol)
-    ticker = get_ticker(symbol)
     try:
-        expirations = ticker.options
+        expirations = _expirations(symbol)
     except Exception as exc:
         return format_response(
             "REALTIME_OPTIONS",
@@ -68,6 +83,8 @@ def realtime_options(symbol: str, *, expiration: Optional[str] = None) -> Dict[s
 
 
 @ttl_cache(ttl=600, maxsize=256)
+@single_flight
+@persistent_ttl_cache(ttl=600, subdir="option_history")
 def _cached_option_history(contract_symbol: str, start: Optional[str], end: Optional[str], interval: str) -> Dict[str, Any]:
     data = download(
         [contract_symbol],
@@ -76,7 +93,8 @@ def _cached_option_history(contract_symbol: str, start: Optional[str], end: Opti
         period=None,
         interval=interval,
     )
-    return {"data": data}
+    # Records, not the frame, so the on-disk cache stays plain JSON.
+    return {"data": to_serialisable_records(data)}
 
 
 def historical_options(contract_symbol: str, *, start: Optional[str] = None, end: Optional[str] = None, interval: str = "1d") -> Dict[str, Any]:
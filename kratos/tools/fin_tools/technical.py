@@ -4,16 +4,24 @@ Handlers for technical indicator tools using pandas-ta.
 
 from __future__ import annotations
 
-from typing import Any, Callable, Dict, Optional
+from functools import lru_cache, partial
+from typing import Any, Callable, Dict, Optional, Tuple
 
+import numpy as np
 import pandas as pd
 
-from .base import DataFrameLike, ToolExecutionError, ensure_symbol, format_response, history
+from . import _kernels
+from .base import DataFrameLike, ToolExecutionError, ensure_symbol, format_response, history, ttl_cache
 
-try:  # pragma: no cover - optional dependency
-    import pandas_ta as ta  # type: ignore
-except ModuleNotFoundError:  # pragma: no cover - optional dependency
-    ta = None  # type: ignore[assignment]
+
+@lru_cache(maxsize=None)
+def _ta() -> Any:
+    """pandas-ta, imported on first use so loading the tool registry stays cheap; None if absent."""
+    try:  # pragma: no cover - optional dependency
+        import pandas_ta  # type: ignore
+    except ModuleNotFoundError:  # pragma: no cover - optional dependency
+        return None
+    return pandas_ta
 
 
 def _prepare_indicator_history(symbol: str, interval: str = "1d", period: Optional[str] = "200d", start: Optional[str] = None, end: Optional[str] = None) -> pd.DataFrame:
@@ -28,13 +36,16 @@ def _prepare_indicator_history(symbol: str, interval: str = "1d", period: Option
     )
 
 
+_CONTEXT_COLUMNS = (("open", "Open"), ("high", "High"), ("low", "Low"), ("close", "Close"), ("volume", "Volume"))
+
+
 def _tech_indicator_context(data: pd.DataFrame) -> pd.DataFrame:
-    opens = data["Open"].rename("open")
-    highs = data["High"].rename("high")
-    lows = data["Low"].rename("low")
-    closes = data["Close"].rename("close")
-    volumes = data["Volume"].rename("volume")
-    return pd.concat([opens, highs, lows, closes, volumes], axis=1)
+    # Wrap the existing column buffers under lowercase names instead of concatenating copies.
+    return pd.DataFrame(
+        {name: data[column].to_numpy(copy=False) for name, column in _CONTEXT_COLUMNS},
+        index=data.index,
+        copy=False,
+    )
 
 
 def _ensure_length(params: Dict[str, Any], default: int = 14) -> int:
@@ -51,53 +62,90 @@ def _series_indicator(func: Callable[[pd.Series, Dict[str, Any]], DataFrameLike]
     return _wrapped
 
 
+def _kernel_series(kernel: Callable[[np.ndarray, int], np.ndarray], series: pd.Series, length: int, name: str) -> pd.Series:
+    return pd.Series(kernel(series.to_numpy(dtype=np.float64), length), index=series.index, name=name)
+
+
 def _calc_sma(series: pd.Series, params: Dict[str, Any]) -> pd.Series:
-    return ta.sma(series, length=_ensure_length(params, 20))
+    length = _ensure_length(params, 20)
+    if _kernels.sma is not None:
+        return _kernel_series(_kernels.sma, series, length, f"SMA_{length}")
+    return _ta().sma(series, length=length)
 
 
 def _calc_ema(series: pd.Series, params: Dict[str, Any]) -> pd.Series:
-    return ta.ema(series, length=_ensure_length(params, 20))
+    length = _ensure_length(params, 20)
+    if _kernels.ema is not None:
+        return _kernel_series(_kernels.ema, series, length, f"EMA_{length}")
+    return _ta().ema(series, length=length)
 
 
 def _calc_wma(series: pd.Series, params: Dict[str, Any]) -> pd.Series:
-    return ta.wma(series, length=_ensure_length(params, 20))
+    length = _ensure_length(params, 20)
+    weights = np.arange(1, length + 1, dtype=np.float64)
+    values = _kernels.weighted_moving_average(series.to_numpy(dtype=np.float64), weights)
+    return pd.Series(values, index=series.index, name=f"WMA_{length}")
 
 
 def _calc_dema(series: pd.Series, params: Dict[str, Any]) -> pd.Series:
-    return ta.dema(series, length=_ensure_length(params, 20))
+    return _ta().dema(series, length=_ensure_length(params, 20))
 
 
 def _calc_tema(series: pd.Series, params: Dict[str, Any]) -> pd.Series:
-    return ta.tema(series, length=_ensure_length(params, 20))
+    return _ta().tema(series, length=_ensure_length(params, 20))
 
 
 def _calc_trima(series: pd.Series, params: Dict[str, Any]) -> pd.Series:
-    return ta.trima(series, length=_ensure_length(params, 20))
+    length = _ensure_length(params, 20)
+    # pandas-ta defines TRIMA as an SMA of an SMA; as one window that is a triangle.
+    half = round(0.5 * (length + 1))
+    weights = np.convolve(np.ones(half), np.ones(half))
+    values = _kernels.weighted_moving_average(series.to_numpy(dtype=np.float64), weights)
+    return pd.Series(values, index=series.index, name=f"TRIMA_{length}")
 
 
 def _calc_kama(series: pd.Series, params: Dict[str, Any]) -> pd.Series:
     fast = params.get("fast", 2)
     slow = params.get("slow", 30)
     length = _ensure_length(params, 10)
-    return ta.kama(series, length=length, fast=fast, slow=slow)
+    return _ta().kama(series, length=length, fast=fast, slow=slow)
 
 
 def _calc_mama(context: pd.DataFrame, **params: Any) -> pd.DataFrame:
-    return ta.mama(context["close"], fastlimit=params.get("fastlimit", 0.5), slowlimit=params.get("slowlimit", 0.05))
+    return _ta().mama(context["close"], fastlimit=params.get("fastlimit", 0.5), slowlimit=params.get("slowlimit", 0.05))
 
 
 def _calc_vwap(context: pd.DataFrame, **params: Any) -> pd.Series:
-    return ta.vwap(high=context["high"], low=context["low"], close=context["close"], volume=context["volume"])
+    return _ta().vwap(high=context["high"], low=context["low"], close=context["close"], volume=context["volume"])
 
 
 def _calc_t3(series: pd.Series, params: Dict[str, Any]) -> pd.Series:
     length = _ensure_length(params, 20)
     vfactor = float(params.get("vfactor", 0.7))
-    return ta.t3(series, length=length, vfactor=vfactor)
+    return _ta().t3(series, length=length, vfactor=vfactor)
+
+
+def _kernel_macd(close: pd.Series, params: Dict[str, Any]) -> pd.DataFrame:
+    """MACD from the fused kernel, laid out like ``ta.macd`` (line, histogram, signal)."""
+    fast = int(params.get("fastperiod", 12))
+    slow = int(params.get("slowperiod", 26))
+    signal = int(params.get("signalperiod", 9))
+    if min(fast, slow, signal) <= 0:
+        raise ToolExecutionError("fastperiod, slowperiod and signalperiod must be positive.")
+    if slow < fast:
+        fast, slow = slow, fast
+    line, smoothed = _kernels.macd(close.to_numpy(dtype=np.float64), fast, slow, signal)
+    suffix = f"_{fast}_{slow}_{signal}"
+    return pd.DataFrame(
+        {f"MACD{suffix}": line, f"MACDh{suffix}": line - smoothed, f"MACDs{suffix}": smoothed},
+        index=close.index,
+    )
 
 
 def _calc_macd(context: pd.DataFrame, **params: Any) -> pd.DataFrame:
-    return ta.macd(
+    if _kernels.macd is not None:
+        return _kernel_macd(context["close"], params)
+    return _ta().macd(
         context["close"],
         fast=params.get("fastperiod", 12),
         slow=params.get("slowperiod", 26),
@@ -106,7 +154,10 @@ def _calc_macd(context: pd.DataFrame, **params: Any) -> pd.DataFrame:
 
 
 def _calc_macdext(context: pd.DataFrame, **params: Any) -> pd.DataFrame:
-    return ta.macd(
+    # ta.macd takes no ``source``; it always reads the close series it is given.
+    if _kernels.macd is not None:
+        return _kernel_macd(context["close"], params)
+    return _ta().macd(
         context["close"],
         fast=params.get("fastperiod", 12),
         slow=params.get("slowperiod", 26),
@@ -116,7 +167,7 @@ def _calc_macdext(context: pd.DataFrame, **params: Any) -> pd.DataFrame:
 
 
 def _calc_stoch(context: pd.DataFrame, **params: Any) -> pd.DataFrame:
-    return ta.stoch(
+    return _ta().stoch(
         high=context["high"],
         low=context["low"],
         close=context["close"],
@@ -127,7 +178,7 @@ def _calc_stoch(context: pd.DataFrame, **params: Any) -> pd.DataFrame:
 
 
 def _calc_stochf(context: pd.DataFrame, **params: Any) -> pd.DataFrame:
-    return ta.stochf(
+    return _ta().stochf(
         high=context["high"],
         low=context["low"],
         close=context["close"],
@@ -137,31 +188,34 @@ def _calc_stochf(context: pd.DataFrame, **params: Any) -> pd.DataFrame:
 
 
 def _calc_rsi(series: pd.Series, params: Dict[str, Any]) -> pd.Series:
-    return ta.rsi(series, length=_ensure_length(params, 14))
+    length = _ensure_length(params, 14)
+    if _kernels.rsi is not None:
+        return _kernel_series(_kernels.rsi, series, length, f"RSI_{length}")
+    return _ta().rsi(series, length=length)
 
 
 def _calc_stochrsi(series: pd.Series, params: Dict[str, Any]) -> pd.DataFrame:
-    return ta.stochrsi(series, length=_ensure_length(params, 14))
+    return _ta().stochrsi(series, length=_ensure_length(params, 14))
 
 
 def _calc_willr(context: pd.DataFrame, **params: Any) -> pd.Series:
-    return ta.willr(high=context["high"], low=context["low"], close=context["close"], length=_ensure_length(params, 14))
+    return _ta().willr(high=context["high"], low=context["low"], close=context["close"], length=_ensure_length(params, 14))
 
 
 def _calc_adx(context: pd.DataFrame, **params: Any) -> pd.Series:
-    return ta.adx(high=context["high"], low=context["low"], close=context["close"], length=_ensure_length(params, 14))
+    return _ta().adx(high=context["high"], low=context["low"], close=context["close"], length=_ensure_length(params, 14))
 
 
 def _calc_adxr(context: pd.DataFrame, **params: Any) -> pd.Series:
-    return ta.adxr(high=context["high"], low=context["low"], close=context["close"], length=_ensure_length(params, 14))
+    return _ta().adxr(high=context["high"], low=context["low"], close=context["close"], length=_ensure_length(params, 14))
 
 
 def _calc_apo(series: pd.Series, params: Dict[str, Any]) -> pd.Series:
-    return ta.apo(series, fast=params.get("fastperiod", 12), slow=params.get("slowperiod", 26))
+    return _ta().apo(series, fast=params.get("fastperiod", 12), slow=params.get("slowperiod", 26))
 
 
 def _calc_ppo(series: pd.Series, params: Dict[str, Any]) -> pd.Series:
-    return ta.ppo(
+    return _ta().ppo(
         series,
         fast=params.get("fastperiod", 12),
         slow=params.get("slowperiod", 26),
@@ -170,39 +224,39 @@ def _calc_ppo(series: pd.Series, params: Dict[str, Any]) -> pd.Series:
 
 
 def _calc_mom(series: pd.Series, params: Dict[str, Any]) -> pd.Series:
-    return ta.mom(series, length=_ensure_length(params, 10))
+    return _ta().mom(series, length=_ensure_length(params, 10))
 
 
 def _calc_bop(context: pd.DataFrame, **params: Any) -> pd.Series:
-    return ta.bop(open_=context["open"], high=context["high"], low=context["low"], close=context["close"])
+    return _ta().bop(open_=context["open"], high=context["high"], low=context["low"], close=context["close"])
 
 
 def _calc_cci(context: pd.DataFrame, **params: Any) -> pd.Series:
-    return ta.cci(high=context["high"], low=context["low"], close=context["close"], length=_ensure_length(params, 20))
+    return _ta().cci(high=context["high"], low=context["low"], close=context["close"], length=_ensure_length(params, 20))
 
 
 def _calc_cmo(series: pd.Series, params: Dict[str, Any]) -> pd.Series:
-    return ta.cmo(series, length=_ensure_length(params, 14))
+    return _ta().cmo(series, length=_ensure_length(params, 14))
 
 
 def _calc_roc(series: pd.Series, params: Dict[str, Any]) -> pd.Series:
-    return ta.roc(series, length=_ensure_length(params, 10))
+    return _ta().roc(series, length=_ensure_length(params, 10))
 
 
 def _calc_rocr(series: pd.Series, params: Dict[str, Any]) -> pd.Series:
-    return ta.rocr(series, length=_ensure_length(params, 10))
+    return _ta().rocr(series, length=_ensure_length(params, 10))
 
 
 def _calc_aroon(context: pd.DataFrame, **params: Any) -> pd.DataFrame:
-    return ta.aroon(high=context["high"], low=context["low"], length=_ensure_length(params, 14))
+    return _ta().aroon(high=context["high"], low=context["low"], length=_ensure_length(params, 14))
 
 
 def _calc_aroonosc(context: pd.DataFrame, **params: Any) -> pd.Series:
-    return ta.aroonosc(high=context["high"], low=context["low"], length=_ensure_length(params, 14))
+    return _ta().aroonosc(high=context["high"], low=context["low"], length=_ensure_length(params, 14))
 
 
 def _calc_mfi(context: pd.DataFrame, **params: Any) -> pd.Series:
-    return ta.mfi(
+    return _ta().mfi(
         high=context["high"],
         low=context["low"],
         close=context["close"],
@@ -212,99 +266,99 @@ def _calc_mfi(context: pd.DataFrame, **params: Any) -> pd.Series:
 
 
 def _calc_trix(series: pd.Series, params: Dict[str, Any]) -> pd.Series:
-    return ta.trix(series, length=_ensure_length(params, 15))
+    return _ta().trix(series, length=_ensure_length(params, 15))
 
 
 def _calc_ultosc(context: pd.DataFrame, **params: Any) -> pd.Series:
-    return ta.uo(high=context["high"], low=context["low"], close=context["close"])
+    return _ta().uo(high=context["high"], low=context["low"], close=context["close"])
 
 
 def _calc_dx(context: pd.DataFrame, **params: Any) -> pd.Series:
-    return ta.dx(high=context["high"], low=context["low"], close=context["close"], length=_ensure_length(params, 14))
+    return _ta().dx(high=context["high"], low=context["low"], close=context["close"], length=_ensure_length(params, 14))
 
 
 def _calc_minus_di(context: pd.DataFrame, **params: Any) -> pd.Series:
-    return ta.minus_di(high=context["high"], low=context["low"], close=context["close"], length=_ensure_length(params, 14))
+    return _ta().minus_di(high=context["high"], low=context["low"], close=context["close"], length=_ensure_length(params, 14))
 
 
 def _calc_plus_di(context: pd.DataFrame, **params: Any) -> pd.Series:
-    return ta.plus_di(high=context["high"], low=context["low"], close=context["close"], length=_ensure_length(params, 14))
+    return _ta().plus_di(high=context["high"], low=context["low"], close=context["close"], length=_ensure_length(params, 14))
 
 
 def _calc_minus_dm(context: pd.DataFrame, **params: Any) -> pd.Series:
-    return ta.minus_dm(high=context["high"], low=context["low"], length=_ensure_length(params, 14))
+    return _ta().minus_dm(high=context["high"], low=context["low"], length=_ensure_length(params, 14))
 
 
 def _calc_plus_dm(context: pd.DataFrame, **params: Any) -> pd.Series:
-    return ta.plus_dm(high=context["high"], low=context["low"], length=_ensure_length(params, 14))
+    return _ta().plus_dm(high=context["high"], low=context["low"], length=_ensure_length(params, 14))
 
 
 def _calc_bbands(context: pd.DataFrame, **params: Any) -> pd.DataFrame:
     length = _ensure_length(params, 20)
     std = int(params.get("nbdevup", params.get("nbdevdn", 2)))
-    return ta.bbands(context["close"], length=length, std=std)
+    return _ta().bbands(context["close"], length=length, std=std)
 
 
 def _calc_midpoint(context: pd.DataFrame, **params: Any) -> pd.Series:
-    return ta.midpoint(context["close"], length=_ensure_length(params, 14))
+    return _ta().midpoint(context["close"], length=_ensure_length(params, 14))
 
 
 def _calc_midprice(context: pd.DataFrame, **params: Any) -> pd.Series:
-    return ta.midprice(high=context["high"], low=context["low"], length=_ensure_length(params, 14))
+    return _ta().midprice(high=context["high"], low=context["low"], length=_ensure_length(params, 14))
 
 
 def _calc_sar(context: pd.DataFrame, **params: Any) -> pd.Series:
-    return ta.psar(high=context["high"], low=context["low"], close=context["close"])
+    return _ta().psar(high=context["high"], low=context["low"], close=context["close"])
 
 
 def _calc_trange(context: pd.DataFrame, **params: Any) -> pd.Series:
-    return ta.true_range(high=context["high"], low=context["low"], close=context["close"])
+    return _ta().true_range(high=context["high"], low=context["low"], close=context["close"])
 
 
 def _calc_atr(context: pd.DataFrame, **params: Any) -> pd.Series:
-    return ta.atr(high=context["high"], low=context["low"], close=context["close"], length=_ensure_length(params, 14))
+    return _ta().atr(high=context["high"], low=context["low"], close=context["close"], length=_ensure_length(params, 14))
 
 
 def _calc_natr(context: pd.DataFrame, **params: Any) -> pd.Series:
-    return ta.natr(high=context["high"], low=context["low"], close=context["close"], length=_ensure_length(params, 14))
+    return _ta().natr(high=context["high"], low=context["low"], close=context["close"], length=_ensure_length(params, 14))
 
 
 def _calc_ad(context: pd.DataFrame, **params: Any) -> pd.Series:
-    return ta.ad(high=context["high"], low=context["low"], close=context["close"], volume=context["volume"])
+    return _ta().ad(high=context["high"], low=context["low"], close=context["close"], volume=context["volume"])
 
 
 def _calc_adosc(context: pd.DataFrame, **params: Any) -> pd.Series:
     fast = params.get("fastperiod", 3)
     slow = params.get("slowperiod", 10)
-    return ta.adosc(high=context["high"], low=context["low"], close=context["close"], volume=context["volume"], fast=fast, slow=slow)
+    return _ta().adosc(high=context["high"], low=context["low"], close=context["close"], volume=context["volume"], fast=fast, slow=slow)
 
 
 def _calc_obv(context: pd.DataFrame, **params: Any) -> pd.Series:
-    return ta.obv(close=context["close"], volume=context["volume"])
+    return _ta().obv(close=context["close"], volume=context["volume"])
 
 
 def _calc_ht_trendline(context: pd.DataFrame, **params: Any) -> pd.Series:
-    return ta.ht_trendline(context["close"])
+    return _ta().ht_trendline(context["close"])
 
 
 def _calc_ht_sine(context: pd.DataFrame, **params: Any) -> pd.DataFrame:
-    return ta.ht_sine(context["close"])
+    return _ta().ht_sine(context["close"])
 
 
 def _calc_ht_trendmode(context: pd.DataFrame, **params: Any) -> pd.Series:
-    return ta.ht_trendmode(context["close"])
+    return _ta().ht_trendmode(context["close"])
 
 
 def _calc_ht_dcperiod(context: pd.DataFrame, **params: Any) -> pd.Series:
-    return ta.ht_dcperiod(context["close"])
+    return _ta().ht_dcperiod(context["close"])
 
 
 def _calc_ht_dcphase(context: pd.DataFrame, **params: Any) -> pd.Series:
-    return ta.ht_dcphase(context["close"])
+    return _ta().ht_dcphase(context["close"])
 
 
 def _calc_ht_phasor(context: pd.DataFrame, **params: Any) -> pd.DataFrame:
-    return ta.ht_phasor(context["close"])
+    return _ta().ht_phasor(context["close"])
 
 
 _TECHNICAL_DISPATCH: Dict[str, Callable[..., DataFrameLike]] = {
@@ -364,6 +418,58 @@ _TECHNICAL_DISPATCH: Dict[str, Callable[..., DataFrameLike]] = {
 }
 
 
+class _CalculationError(Exception):
+    """Raised when an indicator calculator fails, as opposed to the history fetch."""
+
+
+_MIN_HISTORY_ROWS = 50  # Most indicators need at least 20-50 data points
+
+
+def _result_limit(params: Dict[str, Any]) -> Optional[int]:
+    """Pop the optional ``limit``: how many of the latest points to return, or None for all."""
+    limit = params.pop("limit", None)
+    if limit is None:
+        return None
+    limit = int(limit)
+    if limit <= 0:
+        raise ToolExecutionError("limit must be positive.")
+    return limit
+
+
+# Calculators only read the context, so one uncopied frame is shared between them.
+@ttl_cache(ttl=300, maxsize=32, copy=False)
+def _cached_context(
+    symbol: str,
+    interval: str,
+    period: Optional[str],
+    start: Optional[str],
+    end: Optional[str],
+) -> pd.DataFrame:
+    history_df = _prepare_indicator_history(symbol, interval=interval, period=period, start=start, end=end)
+    return _tech_indicator_context(history_df)
+
+
+@ttl_cache(ttl=300, maxsize=256)
+def _cached_indicator(
+    tool_name: str,
+    symbol: str,
+    interval: str,
+    period: Optional[str],
+    start: Optional[str],
+    end: Optional[str],
+    params: Tuple[Tuple[str, Any], ...],
+) -> Dict[str, Any]:
+    context = _cached_context(symbol, interval, period, start, end)
+    rows = len(context)
+    if rows < _MIN_HISTORY_ROWS:
+        return {"rows": rows, "result": None}
+    try:
+        result = _TECHNICAL_DISPATCH[tool_name](context, **dict(params))
+    except Exception as exc:
+        raise _CalculationError(str(exc)) from exc
+    return {"rows": rows, "result": result}
+
+
 def calculate_technical_indicator(
     tool_name: str,
     *,
@@ -374,7 +480,7 @@ def calculate_technical_indicator(
     end: Optional[str] = None,
     **params: Any,
 ) -> Dict[str, Any]:
-    if ta is None:
+    if _ta() is None:
         return format_response(
             tool_name,
             symbol=symbol,
@@ -384,10 +490,28 @@ def calculate_technical_indicator(
         )
     
     symbol = ensure_symbol(symbol)
+    if tool_name not in _TECHNICAL_DISPATCH:
+        return format_response(
+            tool_name,
+            symbol=symbol,
+            error="unsupported_indicator",
+            message=f"Technical indicator {tool_name} is not supported.",
+            suggestion="Use one of the supported technical indicators.",
+            supported_indicators=list(_TECHNICAL_DISPATCH.keys())[:10]  # Show first 10
+        )
     
-    # Try to get historical data
+    # The tool runtime is injected per call and never affects the calculation.
+    params.pop("runtime", None)
+    limit = _result_limit(params)
+    key = tuple(sorted(params.items()))
     try:
-        history_df = _prepare_indicator_history(symbol, interval=interval, period=period, start=start, end=end)
+        hash(key)
+        compute = _cached_indicator
+    except TypeError:
+        compute = _cached_indicator.__wrapped__
+    
+    try:
+        payload = compute(tool_name, symbol, interval, period, start, end, key)
     except ToolExecutionError as exc:
         return format_response(
             tool_name,
@@ -398,45 +522,33 @@ def calculate_technical_indicator(
             message=f"Could not retrieve historical data for {symbol}: {exc}",
             suggestion="Try a different symbol, time period, or check if the symbol exists and has trading data."
         )
-    
-    # Check if we have enough data
-    if len(history_df) < 50:  # Most indicators need at least 20-50 data points
+    except _CalculationError as exc:
         return format_response(
             tool_name,
             symbol=symbol,
             interval=interval,
             period=period,
-            error="insufficient_data",
-            message=f"Insufficient historical data for {tool_name} calculation. Got {len(history_df)} data points, need at least 50.",
-            suggestion="Try a longer time period (e.g., '1y' instead of '1mo') or a different interval to get more data points.",
-            available_data_points=len(history_df),
-            recommended_period="1y"
+            error="calculation_failed",
+            message=f"Failed to calculate {tool_name} for {symbol}: {exc}",
+            suggestion="Try different parameters, a longer time period, or check if the symbol has sufficient trading data.",
+            parameters_used=params
         )
     
-    context = _tech_indicator_context(history_df)
-    calculator = _TECHNICAL_DISPATCH.get(tool_name)
-    if calculator is None:
-        return format_response(
-            tool_name,
-            symbol=symbol,
-            error="unsupported_indicator",
-            message=f"Technical indicator {tool_name} is not supported.",
-            suggestion="Use one of the supported technical indicators.",
-            supported_indicators=list(_TECHNICAL_DISPATCH.keys())[:10]  # Show first 10
-        )
+    rows = payload["rows"]
+    result = payload["result"]
     
-    try:
-        result = calculator(context, **params)
-    except Exception as exc:
+    # Check if we have enough data
+    if rows < _MIN_HISTORY_ROWS:
         return format_response(
             tool_name,
             symbol=symbol,
             interval=interval,
             period=period,
-            error="calculation_failed",
-            message=f"Failed to calculate {tool_name} for {symbol}: {exc}",
-            suggestion="Try different parameters, a longer time period, or check if the symbol has sufficient trading data.",
-            parameters_used=params
+            error="insufficient_data",
+            message=f"Insufficient historical data for {tool_name} calculation. Got {rows} data points, need at least {_MIN_HISTORY_ROWS}.",
+            suggestion="Try a longer time period (e.g., '1y' instead of '1mo') or a different interval to get more data points.",
+            available_data_points=rows,
+            recommended_period="1y"
         )
     
     # Check if calculation returned valid data
@@ -449,7 +561,7 @@ def calculate_technical_indicator(
             error="no_data_returned",
             message=f"{tool_name} calculation returned no data.",
             suggestion="This may be due to insufficient data or invalid parameters. Try a longer time period or different parameters.",
-            data_points_available=len(history_df),
+            data_points_available=rows,
             recommended_period="1y"
         )
     
@@ -477,6 +589,16 @@ def calculate_technical_indicator(
             recommended_period="1y"
         )
     
+    if limit is not None and len(result) > limit:
+        return format_response(
+            tool_name,
+            symbol=symbol,
+            interval=interval,
+            period=period,
+            data=result.iloc[-limit:],
+            total_points=len(result),
+        )
+
     return format_response(
         tool_name,
         symbol=symbol,
@@ -486,17 +608,10 @@ def calculate_technical_indicator(
     )
 
 
+# The keyword-only signature already routes symbol/interval/period/start/end and
+# collects indicator parameters, so handlers bind the tool name and nothing else.
 HANDLERS: Dict[str, Callable[..., Dict[str, Any]]] = {
-    name: (lambda tool=name: (lambda **kwargs: calculate_technical_indicator(
-        tool,
-        symbol=kwargs["symbol"],
-        interval=kwargs.get("interval", "1d"),
-        period=kwargs.get("period", "200d"),
-        start=kwargs.get("start"),
-        end=kwargs.get("end"),
-        **{k: v for k, v in kwargs.items() if k not in {"symbol", "interval", "period", "start", "end"}}
-    )))()
-    for name in _TECHNICAL_DISPATCH
+    name: partial(calculate_technical_indicator, name) for name in _TECHNICAL_DISPATCH
 }
 
 
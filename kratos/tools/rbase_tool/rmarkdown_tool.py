@@ -1,11 +1,13 @@
 from __future__ import annotations
 
 import os
+import queue
 import subprocess
+import threading
 import time
 from dataclasses import dataclass, field as dataclass_field
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from langchain_core.tools import tool
 from pydantic import BaseModel, Field
@@ -54,6 +56,144 @@ def _as_r_string(value: str) -> str:
     return f"'{escaped}'"
 
 
+_RENDER_TIMEOUT = 120
+_DONE_MARKER = "__KRATOS_RMARKDOWN_DONE__"
+
+# Shared by the worker and the one-off fallback so both render with the same options.
+_RENDER_FUNCTION = """
+kratos_render <- function(input, output_file, output_dir) {
+  rmarkdown::render(input = input, output_file = output_file, output_dir = output_dir,
+                    output_format = "pdf_document", clean = TRUE, envir = new.env())
+}
+"""
+
+# Puts the worker back to its post-start-up state after each request, so one
+# document's options, attached packages, knitr settings, globals and RNG seed
+# cannot leak into the next. The one-off fallback starts from a fresh R anyway.
+_RESET_FUNCTION = """
+kratos_reset <- function() {
+  added <- setdiff(names(options()), names(kratos_options))
+  options(c(kratos_options, setNames(vector("list", length(added)), added)))
+  for (name in setdiff(search(), kratos_search)) {
+    try(detach(name, character.only = TRUE), silent = TRUE)
+  }
+  if ("knitr" %in% loadedNamespaces()) {
+    knitr::opts_chunk$restore()
+    knitr::opts_knit$restore()
+    knitr::knit_hooks$restore()
+  }
+  rm(list = setdiff(ls(globalenv(), all.names = TRUE), kratos_globals), envir = globalenv())
+}
+"""
+
+# R read-eval loop: loads rmarkdown once, then renders one tab separated
+# ``input, output_file, output_dir, working_dir`` request per stdin line.
+_WORKER_BOOTSTRAP = _RENDER_FUNCTION + _RESET_FUNCTION + f"""
+suppressMessages(library(rmarkdown))
+con <- file("stdin", open = "r")
+kratos_options <- options()
+kratos_search <- search()
+kratos_globals <- c(setdiff(ls(globalenv(), all.names = TRUE), ".Random.seed"), "kratos_globals")
+repeat {{
+  line <- readLines(con, n = 1)
+  if (length(line) == 0) break
+  args <- strsplit(line, "\\t", fixed = TRUE)[[1]]
+  status <- tryCatch({{
+    setwd(args[4])
+    kratos_render(args[1], args[2], args[3])
+    "OK"
+  }}, error = function(e) paste("ERROR", gsub("[\\r\\n]+", " ", conditionMessage(e))),
+  finally = try(kratos_reset(), silent = TRUE))
+  cat("\\n{_DONE_MARKER} ", status, "\\n", sep = "")
+  flush(stdout())
+}}
+"""
+
+
+class _WorkerUnavailable(Exception):
+    """The persistent R worker cannot serve this request; render in a fresh process."""
+
+
+class _RWorker:
+    """Long-lived ``Rscript`` process so renders skip R start-up and package loading."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._process: Optional[subprocess.Popen] = None
+        self._lines: "queue.Queue[Optional[str]]" = queue.Queue()
+        self._served = 0
+        self._disabled = False
+
+    def _start(self) -> None:
+        process = subprocess.Popen(
+            ["Rscript", "-e", _WORKER_BOOTSTRAP],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            bufsize=1,
+        )
+        lines: "queue.Queue[Optional[str]]" = queue.Queue()
+        threading.Thread(target=self._pump, args=(process.stdout, lines), daemon=True).start()
+        self._process, self._lines, self._served = process, lines, 0
+
+    @staticmethod
+    def _pump(stream: Any, lines: "queue.Queue[Optional[str]]") -> None:
+        for line in stream:
+            lines.put(line)
+        lines.put(None)
+
+    def _stop(self) -> None:
+        if self._process is not None:
+            self._process.kill()
+            self._process.wait()
+            self._process = None
+
+    def render(self, fields: Tuple[str, ...], timeout: float) -> Tuple[bool, str, str]:
+        """Render one document; returns ``(succeeded, log, status)``.
+
+        ``timeout`` covers waiting behind other renders as well as this one.
+        """
+        if any("\t" in value or "\n" in value for value in fields):
+            raise _WorkerUnavailable()
+        deadline = time.monotonic() + timeout
+        if not self._lock.acquire(timeout=timeout):
+            raise subprocess.TimeoutExpired("Rscript", timeout)
+        try:
+            if self._disabled:
+                raise _WorkerUnavailable()
+            if self._process is None or self._process.poll() is not None:
+                self._start()
+            try:
+                self._process.stdin.write("\t".join(fields) + "\n")
+                self._process.stdin.flush()
+            except OSError as exc:
+                self._stop()
+                raise _WorkerUnavailable() from exc
+            log: List[str] = []
+            while True:
+                try:
+                    line = self._lines.get(timeout=max(deadline - time.monotonic(), 0))
+                except queue.Empty:
+                    self._stop()
+                    raise subprocess.TimeoutExpired("Rscript", timeout, output="".join(log))
+                if line is None:
+                    # A worker that never completed a render will not start next time either.
+                    self._disabled = self._served == 0
+                    self._stop()
+                    raise _WorkerUnavailable()
+                if line.startswith(_DONE_MARKER):
+                    self._served += 1
+                    status = line[len(_DONE_MARKER):].strip()
+                    return status == "OK", "".join(log), status
+                log.append(line)
+        finally:
+            self._lock.release()
+
+
+_R_WORKER = _RWorker()
+
+
 @tool(
     description="Render RMarkdown documents to PDF using the system Rscript executable.",
     args_schema=RenderRMarkdownArgs,
@@ -67,10 +207,11 @@ def rmarkdown_pdf_executor(
 ) -> RMarkdownExecutionResponse:
     """Render an RMarkdown document to a PDF file using ``rmarkdown::render``.
 
-    The tool invokes the system ``Rscript`` binary with a short expression that
-    loads and renders the supplied RMarkdown document. Outputs and errors from
-    the R process are captured and returned alongside metadata describing the
-    run.
+    Documents are rendered by a persistent ``Rscript`` worker that keeps
+    rmarkdown loaded between calls; when it is unavailable the system
+    ``Rscript`` binary is invoked with a short render expression instead.
+    Outputs and errors from the R process are captured and returned alongside
+    metadata describing the run.
     """
 
     start_time = time.time()
@@ -98,25 +239,27 @@ def rmarkdown_pdf_executor(
 
     output_path = os.path.join(resolved_output_dir, output_name)
 
-    render_expression = (
-        "rmarkdown::render("
-        f"input = {_as_r_string(input_path)}, "
-        f"output_file = {_as_r_string(output_name)}, "
-        f"output_dir = {_as_r_string(resolved_output_dir)}, "
-        "output_format = 'pdf_document', "
-        "clean = TRUE"
-        ")"
-    )
-
     try:
-        result = subprocess.run(
-            ["Rscript", "-e", render_expression],
-            capture_output=True,
-            text=True,
-            timeout=120,
-            check=False,
-            cwd=input_dir,
-        )
+        try:
+            rendered, log, status = _R_WORKER.render(
+                (input_path, output_name, resolved_output_dir, input_dir), timeout=_RENDER_TIMEOUT
+            )
+            result = subprocess.CompletedProcess(
+                ["Rscript"], 0 if rendered else 1, stdout=log, stderr="" if rendered else log + status
+            )
+        except _WorkerUnavailable:
+            render_expression = _RENDER_FUNCTION + (
+                f"kratos_render({_as_r_string(input_path)}, "
+                f"{_as_r_string(output_name)}, {_as_r_string(resolved_output_dir)})"
+            )
+            result = subprocess.run(
+                ["Rscript", "-e", render_expression],
+                capture_output=True,
+                text=True,
+                timeout=_RENDER_TIMEOUT,
+                check=False,
+                cwd=input_dir,
+            )
 
         duration = time.time() - start_time
         success = result.returncode == 0 and os.path.exists(output_path)
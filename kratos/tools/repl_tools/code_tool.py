@@ -3,7 +3,9 @@ from langchain_core.tools import tool
 from pydantic import BaseModel, Field
 from dataclasses import dataclass, field as dataclass_field
 from typing import Any, List, Dict, Optional
+import os
 import subprocess
+import sys
 import time
 
 
@@ -70,7 +72,7 @@ def session_code_executor(py_file_name: str,
     """
     # Only save if payload is large AND session_id is available
     
-    py_file_path = f"{code_path}/{py_file_name}"
+    py_file_path = os.path.join(code_path, py_file_name)
     print(f"Trying to Execute {py_file_path}")
 
     start_time = time.time()
@@ -78,11 +80,13 @@ def session_code_executor(py_file_name: str,
     try:
         # Run the Python file as a subprocess with timeout
         result = subprocess.run(
-            ['python', py_file_path],
+            # Run under this interpreter rather than whichever ``python`` PATH resolves.
+            [sys.executable, py_file_path],
             capture_output=True,
             text=True,
             timeout=30,
-            check=False
+            check=False,
+            env={**os.environ, "PYTHONDONTWRITEBYTECODE": "1", "PYTHONUNBUFFERED": "1"},
         )
         
         duration = time.time() - start_time
@@ -1,6 +1,13 @@
-from ddgs import DDGS
 from langchain.tools import tool
 
+
+def _ddgs():
+    # Imported on first search so loading the tool registry skips the HTTP client stack.
+    from ddgs import DDGS
+
+    return DDGS()
+
+
 @tool
 def search_web(query: str="", max_results: int =5):
     """DDGS text metasearch.
@@ -14,7 +21,7 @@ def search_web(query: str="", max_results: int =5):
     """
     try:
 
-        return DDGS().text(query=query, max_results=max_results)
+        return _ddgs().text(query=query, max_results=max_results)
     except Exception as ex:
         return {"status": "Failed at webserach", "msg": f"try again later {ex}"}
 
@@ -31,7 +38,7 @@ def search_news(query: str="", max_results: int =5):
         List of dictionaries with search results.
     """
     try:
-        return DDGS().news(query=query,max_results=max_results)
+        return _ddgs().news(query=query,max_results=max_results)
     except Exception as ex:
         return {"status": "Fail at searching news", "msg": f"try again later {ex}"}
 
@@ -0,0 +1,51 @@
+import datetime
+import os
+import time
+
+import pytest
+
+pytest.importorskip("numpy")
+pytest.importorskip("pandas")
+pytest.importorskip("yfinance")
+
+from kratos.tools.fin_tools import base
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setenv("KRATOS_CACHE_DIR", str(tmp_path))
+    base._cache_root.cache_clear()
+    yield tmp_path
+    base._cache_root.cache_clear()
+
+
+def test_persistent_cache_miss_matches_hit(cache_dir):
+    calls = []
+
+    @base.persistent_ttl_cache(ttl=60, subdir="test_roundtrip")
+    def fetch(value):
+        calls.append(value)
+        return {"value": value, "as_of": datetime.date(2024, 1, 2)}
+
+    miss = fetch(1)
+    assert fetch(1) == miss == {"value": 1, "as_of": "2024-01-02"}
+    assert calls == [1]
+
+
+def test_persistent_cache_drops_stale_and_excess_files(cache_dir):
+    @base.persistent_ttl_cache(ttl=60, subdir="test_bounds", maxsize=2)
+    def fetch(value):
+        return {"value": value}
+
+    for value in range(4):
+        fetch(value)
+    directory = cache_dir / "test_bounds"
+    assert len(list(directory.glob("*.json"))) == 2
+
+    (stale,) = [path for path in directory.glob("*.json") if b'"value": 3' in path.read_bytes()]
+    os.utime(stale, (time.time() - 120, time.time() - 120))
+    fetch(3)
+    assert stale.stat().st_mtime > time.time() - 60
+
+    base.clear_caches()
+    assert not directory.exists()
@@ -0,0 +1,86 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+pytest.importorskip("pandas")
+
+from kratos.tools.fin_tools import _kernels
+
+
+def _layouts(values):
+    """The same prices as a writable, a read-only and a strided array."""
+    writable = np.ascontiguousarray(values, dtype=np.float64)
+    readonly = writable.copy()
+    readonly.setflags(write=False)
+    strided = np.repeat(writable, 2)[::2]
+    return {"writable": writable, "readonly": readonly, "strided": strided}
+
+
+@pytest.fixture
+def prices():
+    rng = np.random.default_rng(7)
+    return 100.0 + np.cumsum(rng.normal(0.0, 1.0, 300))
+
+
+def test_sliding_stats_accepts_every_layout(prices):
+    expected = _kernels._sliding_stats_loop(np.ascontiguousarray(prices), 30, 5)
+    for name, values in _layouts(prices).items():
+        returns, vols = _kernels.sliding_stats(values, 30, 5)
+        np.testing.assert_allclose(returns, expected[0], err_msg=name)
+        np.testing.assert_allclose(vols, expected[1], err_msg=name)
+
+
+@pytest.mark.parametrize(
+    "kernel, loop",
+    [("sma", "_sma_loop"), ("ema", "_ema_loop"), ("rsi", "_rsi_loop")],
+)
+def test_series_kernels_accept_every_layout(prices, kernel, loop):
+    compiled = getattr(_kernels, kernel)
+    if compiled is None:
+        pytest.skip("numba not available")
+    expected = getattr(_kernels, loop)(np.ascontiguousarray(prices), 14)
+    for name, values in _layouts(prices).items():
+        np.testing.assert_allclose(compiled(values, 14), expected, equal_nan=True, err_msg=name)
+
+
+def test_macd_kernel_accepts_every_layout(prices):
+    if _kernels.macd is None:
+        pytest.skip("numba not available")
+    expected = _kernels._macd_loop(np.ascontiguousarray(prices), 12, 26, 9)
+    for name, values in _layouts(prices).items():
+        line, signal = _kernels.macd(values, 12, 26, 9)
+        np.testing.assert_allclose(line, expected[0], equal_nan=True, err_msg=name)
+        np.testing.assert_allclose(signal, expected[1], equal_nan=True, err_msg=name)
+
+
+def test_sliding_stats_matches_numpy_on_dataframe_column(prices):
+    pd = pytest.importorskip("pandas")
+    index = pd.date_range("2024-01-01", periods=prices.shape[0], freq="D")
+    closing = pd.DataFrame({"Close": prices}, index=index)["Close"].to_numpy(dtype=np.float64)
+    for window, step in ((30, 5), (2, 1), (300, 1)):
+        returns, vols = _kernels.sliding_stats(closing, window, step)
+        expected_returns, expected_vols = _kernels._sliding_stats_numpy(closing, window, step)
+        np.testing.assert_allclose(returns, expected_returns)
+        np.testing.assert_allclose(vols, expected_vols, equal_nan=True)
+
+
+@pytest.mark.parametrize("kernel", ["sma", "ema", "rsi"])
+def test_series_kernels_match_pandas_ta(prices, kernel):
+    pd = pytest.importorskip("pandas")
+    ta = pytest.importorskip("pandas_ta")
+    compiled = getattr(_kernels, kernel)
+    if compiled is None:
+        pytest.skip("numba not available")
+    close = pd.Series(prices)
+    expected = getattr(ta, kernel)(close, length=14, talib=False).to_numpy()
+    np.testing.assert_allclose(compiled(prices, 14), expected, rtol=1e-9, atol=1e-9, equal_nan=True)
+
+
+def test_macd_kernel_matches_pandas_ta(prices):
+    pd = pytest.importorskip("pandas")
+    ta = pytest.importorskip("pandas_ta")
+    if _kernels.macd is None:
+        pytest.skip("numba not available")
+    expected = ta.macd(pd.Series(prices), fast=12, slow=26, signal=9, talib=False)
+    line, signal = _kernels.macd(prices, 12, 26, 9)
+    np.testing.assert_allclose(line, expected["MACD_12_26_9"].to_numpy(), rtol=1e-9, atol=1e-9, equal_nan=True)
+    np.testing.assert_allclose(signal, expected["MACDs_12_26_9"].to_numpy(), rtol=1e-9, atol=1e-9, equal_nan=True)
@@ -42,3 +42,135 @@ def test_build_subagents_registers_expected_tools():
     assert "search_web" in by_name, "search_web subagent missing from registry"
     search_tools = {getattr(tool, "name", None) for tool in by_name["search_web"]}
     assert {"search_web", "search_news"} <= search_tools
+
+
+@pytest.mark.skipif(SubAgent is None, reason="deepagents package not available")
+def test_build_enhanced_system_prompt_skips_guidelines_without_options():
+    from kratos.subagents import build_enhanced_system_prompt
+
+    for output_format in ({}, {"type": "flexible", "options": []}):
+        prompt = build_enhanced_system_prompt(
+            base_prompt="base",
+            output_format=output_format,
+            additional_instructions="extra",
+        )
+        assert prompt == "base\n\nextra"
+
+
+@pytest.mark.skipif(SubAgent is None, reason="deepagents package not available")
+def test_register_many_rejects_existing_names_atomically():
+    from kratos.subagents.registry import SubAgentRegistry, SubAgentSpec
+
+    reg = SubAgentRegistry()
+    first = SubAgentSpec(name="a", description="", prompt="", tools=())
+    reg.register(first)
+
+    batch = [
+        SubAgentSpec(name="b", description="", prompt="", tools=()),
+        SubAgentSpec(name="a", description="", prompt="", tools=()),
+    ]
+    with pytest.raises(ValueError, match="a"):
+        reg.register_many(batch)
+
+    assert reg.list() == (first,)
+
+
+@pytest.mark.skipif(SubAgent is None, reason="deepagents package not available")
+def test_sealed_registry_rejects_registration():
+    from kratos.subagents.registry import SubAgentRegistry, SubAgentSpec
+
+    reg = SubAgentRegistry()
+    spec = SubAgentSpec(name="a", description="", prompt="", tools=())
+    reg.register(spec)
+    reg.seal()
+
+    assert reg.sealed
+    assert reg.list() is reg.list()
+    assert dict(reg.specs) == {"a": spec}
+    with pytest.raises(RuntimeError):
+        reg.register(SubAgentSpec(name="b", description="", prompt="", tools=()))
+    with pytest.raises(TypeError):
+        reg.specs["b"] = spec  # type: ignore[index]
+
+
+@pytest.mark.skipif(SubAgent is None, reason="deepagents package not available")
+def test_register_many_rejects_duplicates_within_batch():
+    from kratos.subagents.registry import SubAgentRegistry, SubAgentSpec
+
+    reg = SubAgentRegistry()
+    batch = [
+        SubAgentSpec(name="a", description="", prompt="", tools=()),
+        SubAgentSpec(name="a", description="other", prompt="", tools=()),
+    ]
+    with pytest.raises(ValueError, match="Duplicate"):
+        reg.register_many(batch)
+
+    assert reg.list() == ()
+
+
+@pytest.mark.skipif(SubAgent is None, reason="deepagents package not available")
+def test_spec_modules_expose_registered_spec():
+    from kratos.subagents import specs
+    from kratos.subagents.registry import registry
+
+    assert specs.crypto.SPEC is registry.get("cryptocurrencies")
+    assert not [name for name in vars(specs.crypto) if name.endswith("_spec")]
+
+
+@pytest.mark.skipif(SubAgent is None, reason="deepagents package not available")
+def test_codeact_prompt_is_ascii():
+    from kratos.subagents.system_prompts import SYSTEM_PROMPTS
+
+    SYSTEM_PROMPTS["codeact"]["prompt"].encode("ascii", "strict")
+
+
+@pytest.mark.skipif(SubAgent is None, reason="deepagents package not available")
+def test_search_web_and_technical_indicators_share_output_format():
+    from kratos.subagents.system_prompts import SYSTEM_PROMPTS
+
+    assert (
+        SYSTEM_PROMPTS["search_web"]["output_format"]["options"]
+        is SYSTEM_PROMPTS["technical_indicators"]["output_format"]["options"]
+    )
+
+
+@pytest.mark.skipif(SubAgent is None, reason="deepagents package not available")
+def test_concurrent_get_loads_lazy_spec_once(monkeypatch):
+    import importlib
+    import threading
+    import time
+    import types
+
+    from kratos.subagents.registry import SubAgentRegistry, SubAgentSpec
+
+    registry_module = importlib.import_module("kratos.subagents.registry")
+
+    spec = SubAgentSpec(name="slow", description="", prompt="", tools=())
+    imports = []
+
+    def slow_import(module_path):
+        imports.append(module_path)
+        time.sleep(0.05)
+        return types.SimpleNamespace(SPEC=spec)
+
+    monkeypatch.setattr(registry_module, "import_module", slow_import)
+    reg = SubAgentRegistry()
+    reg.register_lazy({"slow": "fake.slow_spec"})
+
+    results, errors = [], []
+
+    def lookup():
+        try:
+            results.append(reg.get("slow"))
+        except Exception as exc:  # pragma: no cover - reported below
+            errors.append(exc)
+
+    threads = [threading.Thread(target=lookup) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert not errors
+    assert results == [spec] * 4
+    assert imports == ["fake.slow_spec"]